@@ -3,6 +3,9 @@ import os
 from django.conf import settings
 from rest_framework.permissions import BasePermission
 
+# 视为测试环境的 ENV 取值
+TEST_ENV_NAMES = frozenset(["dev", "test", "development", "testing", "local"])
+
 
 def is_test_environment():
     """
@@ -18,18 +21,18 @@ def is_test_environment():
         bool: 是否为测试环境
     """
     # 优先级1：显式配置
-    if hasattr(settings, "DRF_RESOURCE"):
-        explicit = settings.DRF_RESOURCE.get("API_EXPLORER_ENABLED")
+    drf_resource_settings = getattr(settings, "DRF_RESOURCE", None)
+    if drf_resource_settings is not None:
+        explicit = drf_resource_settings.get("API_EXPLORER_ENABLED")
         if explicit is not None:
             return explicit
 
     # 优先级2：DEBUG 模式
-    if hasattr(settings, "DEBUG") and settings.DEBUG:
+    if getattr(settings, "DEBUG", False):
         return True
 
     # 优先级3：环境变量
-    env = os.getenv("ENV", "").lower()
-    if env in ["dev", "test", "development", "testing", "local"]:
+    if os.getenv("ENV", "").lower() in TEST_ENV_NAMES:
         return True
 
     # 默认禁用
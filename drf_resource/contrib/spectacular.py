@@ -194,6 +194,9 @@ def preprocess_resource_routes(endpoints, **kwargs):
         view_cls = getattr(callback, "cls", None)
 
         if view_cls and issubclass(view_cls, ResourceViewSet):
+            # 应用 generate_endpoint 延迟的文档装饰器，不依赖 ViewSet 的 schema 属性
+            view_cls._apply_schema_decorators()
+
             # 获取 action 名称
             actions = getattr(callback, "actions", {})
             action = actions.get(method.lower(), "")
@@ -1,6 +1,8 @@
+from asgiref.sync import sync_to_async
 from django.utils.deprecation import MiddlewareMixin
 
-from drf_resource.utils.local import local
+from drf_resource.utils.local import current_request_var, local
+from drf_resource.utils.request import set_current_request
 
 
 class RequestProvider(MiddlewareMixin):
@@ -9,9 +11,24 @@ class RequestProvider(MiddlewareMixin):
     """
 
     def process_request(self, request):
-        local.current_request = request
+        set_current_request(request)
         return None
 
     def process_response(self, request, response):
         local.clear()
+        current_request_var.set(None)
         return response
+
+    async def __acall__(self, request):
+        """
+        ASGI 下的异步处理
+
+        只在 ContextVar 中绑定 request，不经过 sync_to_async 切换线程执行钩子；
+        同步视图在 sync_to_async 的共享线程中写入的 local 在请求结束后于同一线程清理
+        """
+        token = current_request_var.set(request)
+        try:
+            return await self.get_response(request)
+        finally:
+            current_request_var.reset(token)
+            await sync_to_async(local.clear, thread_sensitive=True)()
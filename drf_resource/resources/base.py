@@ -22,12 +22,13 @@ from rest_framework.serializers import Serializer
 from drf_resource.exceptions import ResourceException
 from drf_resource.exceptions.codes import StandardErrorCodes
 from drf_resource.tasks.celery import run_perform_request
+from drf_resource.utils.request import get_request
+from drf_resource.utils.thread_backend import ThreadPool
 from drf_resource.utils.tools import (
     format_serializer_errors,
     get_serializer_fields,
     render_schema_structured,
 )
-from drf_resource.utils.thread_backend import ThreadPool
 from drf_resource.utils.user import get_request_username
 
 logger = logging.getLogger(__name__)
@@ -90,7 +91,8 @@ result = resource.request({'user_id': 123})
     ```
 
 访问请求对象：
-    在 ViewSet 中使用时，可通过 self._current_request 访问当前的 Django request 对象。
+    在请求上下文中（ViewSet 或 RequestProvider 中间件）调用时，可通过
+    self._current_request 访问当前的 request 对象。
 
     示例：
     ```python
@@ -133,7 +135,8 @@ result = resource.request({'user_id': 123})
 - perform_request() 是抽象方法，子类必须实现
 - RequestSerializer 和 ResponseSerializer 是可选的
 - 返回 HttpResponse 时会跳过 ResponseSerializer 校验
-- 使用 self._current_request 仅在通过 ViewSet 调用时有效
+- self._current_request 返回 ResourceViewSet 或 RequestProvider 中间件设置的当前请求，
+  没有当前请求时为 None
 
 """
 
@@ -150,13 +153,21 @@ class Resource(abc.ABC):
     # 记录所有`support_data_collect`为True的resource请求)
     support_data_collect: ClassVar[bool] = True
 
+    # 是否在 ResourceViewSet 中复用同一个实例处理所有请求（默认关闭）
+    # 复用的实例被并发请求共享：基类不在实例上保存 request_serializer/response_serializer，
+    # 带 url 参数（context）的请求仍单独实例化；子类同样不能在实例上保存请求级状态，
+    # 也不要对 _current_request 赋值（当前请求从上下文读取）
+    reuse_instance: ClassVar[bool] = False
+
+    # 显式绑定到实例上的 request，默认读取当前上下文中的 request（见 _current_request）
+    _bound_request: Any = None
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.RequestSerializer, self.ResponseSerializer = (
             self._search_serializer_class()
         )
         self.context: dict[str, Any] = kwargs.get("context", kwargs)
         self._task_manager: Any = None
-        self._current_request: Any = None
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         # thread safe
@@ -165,11 +176,30 @@ class Resource(abc.ABC):
 
         return ResourceData.objects.request(tmp_resource, args, kwargs)
 
+    @property
+    def _current_request(self) -> Any:
+        """
+        当前请求对象
+
+        优先返回显式绑定到实例上的 request，否则读取当前上下文中的 request，
+        因此 ViewSet 无需在每次请求时向 Resource 实例写入 request。
+        """
+        if self._bound_request is not None:
+            return self._bound_request
+        return get_request(peaceful=True)
+
+    @_current_request.setter
+    def _current_request(self, request: Any) -> None:
+        self._bound_request = request
+
     @property
     def request_serializer(self) -> Serializer | None:
         """
         :rtype: serializers.Serializer
         """
+        if self.reuse_instance:
+            msg = "`.request_serializer` is not available when `reuse_instance` is enabled."
+            raise AssertionError(msg)
         if not hasattr(self, "_request_serializer"):
             msg = "You must call `.validate_request_data()` before accessing `.request_serializer`."
             raise AssertionError(msg)
@@ -180,6 +210,9 @@ class Resource(abc.ABC):
         """
         :rtype: serializers.Serializer
         """
+        if self.reuse_instance:
+            msg = "`.response_serializer` is not available when `reuse_instance` is enabled."
+            raise AssertionError(msg)
         if not hasattr(self, "_response_serializer"):
             msg = "You must call `.validate_response_data()` before accessing `.response_serializer`."
             raise AssertionError(msg)
@@ -209,11 +242,20 @@ class Resource(abc.ABC):
         """
         raise NotImplementedError
 
+    def _keep_serializer(self, name: str, serializer: Serializer | None) -> None:
+        """
+        保存校验用的 serializer，供 request_serializer/response_serializer 读取
+
+        复用的实例被并发请求共享，serializer 只作为局部变量，不保存到实例上
+        """
+        if not self.reuse_instance:
+            setattr(self, name, serializer)
+
     def validate_request_data(self, request_data: Any) -> Any:
         """
         校验请求数据
         """
-        self._request_serializer: Serializer | None = None
+        self._keep_serializer("_request_serializer", None)
         if not self.RequestSerializer:
             return request_data
 
@@ -222,13 +264,13 @@ class Resource(abc.ABC):
             request_serializer = self.RequestSerializer(
                 request_data, many=self.many_request_data
             )
-            self._request_serializer = request_serializer
+            self._keep_serializer("_request_serializer", request_serializer)
             return request_serializer.data
         else:
             request_serializer = self.RequestSerializer(
                 data=request_data, many=self.many_request_data
             )
-            self._request_serializer = request_serializer
+            self._keep_serializer("_request_serializer", request_serializer)
             is_valid_request = request_serializer.is_valid()
             if not is_valid_request:
                 logger.error(
@@ -248,7 +290,7 @@ class Resource(abc.ABC):
         """
         校验返回数据
         """
-        self._response_serializer: Serializer | None = None
+        self._keep_serializer("_response_serializer", None)
         if not self.ResponseSerializer:
             return response_data
 
@@ -257,13 +299,13 @@ class Resource(abc.ABC):
             response_serializer = self.ResponseSerializer(
                 response_data, many=self.many_response_data
             )
-            self._response_serializer = response_serializer
+            self._keep_serializer("_response_serializer", response_serializer)
             return response_serializer.data
         else:
             response_serializer = self.ResponseSerializer(
                 data=response_data, many=self.many_response_data
             )
-            self._response_serializer = response_serializer
+            self._keep_serializer("_response_serializer", response_serializer)
             is_valid_response = response_serializer.is_valid()
             if not is_valid_response:
                 raise ResourceException(
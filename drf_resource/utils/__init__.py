@@ -18,7 +18,11 @@ from drf_resource.utils.local import (
 )
 
 # 请求工具
-from drf_resource.utils.request import get_request
+from drf_resource.utils.request import (
+    get_request,
+    reset_current_request,
+    set_current_request,
+)
 
 # 文本处理工具
 from drf_resource.utils.text import camel_to_underscore, underscore_to_camel
@@ -87,6 +91,8 @@ __all__ = [
     "with_client_operator",
     # 请求工具
     "get_request",
+    "set_current_request",
+    "reset_current_request",
     # Serializer 工具（从 tools.py 移入）
     "FieldType",
     "get_serializer_fields",
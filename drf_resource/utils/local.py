@@ -30,6 +30,7 @@ specific language governing permissions and limitations under the License.
 import threading
 import weakref
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 try:
     from greenlet import getcurrent as get_ident
@@ -38,7 +39,7 @@ except ImportError:  # pragma: no cover - 取决于运行环境是否安装 gree
     from _thread import get_ident
     _HAS_GREENLET = False
 
-__all__ = ["Local", "LocalBase", "local", "get_ident"]
+__all__ = ["Local", "LocalBase", "local", "get_ident", "current_request_var"]
 
 # 只读内部属性，禁止通过普通属性赋值/删除修改
 _READONLY_ATTRS = ("__storage__", "__ident_func__")
@@ -191,6 +192,11 @@ class Local(LocalBase):
 
 local = Local()  # 创建 Local 类的实例
 
+# 当前请求对象。ContextVar 在线程与协程间天然隔离，读取开销低于 Local
+current_request_var: ContextVar = ContextVar(
+    "drf_resource_current_request", default=None
+)
+
 
 @contextmanager
 def with_request_local():
@@ -209,10 +215,12 @@ def with_request_local():
         if hasattr(local, k):
             local_vars[k] = getattr(local, k)
             delattr(local, k)
+    request_token = current_request_var.set(None)
 
     try:
         yield local
     finally:
+        current_request_var.reset(request_token)
         for k, v in list(local_vars.items()):
             setattr(local, k, v)
 
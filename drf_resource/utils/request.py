@@ -1,7 +1,36 @@
-from drf_resource.utils.local import local
+from drf_resource.utils.local import current_request_var, local
+
+
+def set_current_request(request):
+    """
+    设置当前请求对象
+
+    同时写入 current_request_var 与 local，后者供子线程继承（见 ThreadPool）。
+    返回的 token 可传给 reset_current_request，还原为设置前的请求
+    """
+    token = current_request_var.set(request)
+    local.current_request = request
+    return token
+
+
+def reset_current_request(token):
+    """
+    还原 set_current_request 之前的当前请求
+
+    设置前没有请求时同时移除 local 中的请求，避免遗留给同一线程后续处理的请求或任务
+    """
+    current_request_var.reset(token)
+    previous = current_request_var.get()
+    if previous is not None:
+        local.current_request = previous
+    elif hasattr(local, "current_request"):
+        del local.current_request
 
 
 def get_request(peaceful=False):
+    request = current_request_var.get()
+    if request is not None:
+        return request
     if hasattr(local, "current_request"):
         return local.current_request
     elif peaceful:
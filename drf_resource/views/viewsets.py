@@ -8,17 +8,23 @@ an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express o
 specific language governing permissions and limitations under the License.
 """
 
+import functools
+import inspect
+import operator
+import threading
+
+from django.forms.utils import pretty_name
 from django.http import HttpResponse
-from django.utils.decorators import method_decorator
+from django.utils.cache import patch_cache_control
 from django.utils.translation import gettext as _
-from django.views.decorators.cache import cache_control
 from rest_framework import viewsets
-from rest_framework.decorators import action
+from rest_framework.decorators import MethodMapper
 from rest_framework.response import Response
+from rest_framework.schemas import DefaultSchema
 from rest_framework.serializers import Serializer
 
 from drf_resource.resources.base import Resource
-from drf_resource.utils.local import local
+from drf_resource.utils.request import reset_current_request, set_current_request
 
 """
 Resource的ViewSet定义
@@ -33,6 +39,16 @@ Resource的ViewSet定义
 _schema_decorator_func = None
 
 
+def _identity(func):
+    """原样返回视图函数，所有路由共用"""
+    return func
+
+
+def _noop_decorator(request_serializer, response_serializer, method, description):
+    """空装饰器，不生成文档"""
+    return _identity
+
+
 def _get_schema_decorator():
     """
     懒加载获取 schema 装饰器函数
@@ -51,13 +67,6 @@ def _get_schema_decorator():
 
     enable_docs = getattr(resource_settings, "ENABLE_API_DOCS", True)
     if not enable_docs:
-
-        def _noop_decorator(
-            request_serializer, response_serializer, method, description
-        ):
-            """空装饰器，不生成文档"""
-            return lambda f: f
-
         _schema_decorator_func = _noop_decorator
         return _schema_decorator_func
 
@@ -65,6 +74,8 @@ def _get_schema_decorator():
     try:
         from drf_spectacular.utils import extend_schema
 
+        # 多个路由共用同一组 serializer / 描述时直接复用已构建的 extend_schema 装饰器
+        @functools.cache
         def spectacular_decorator(
             request_serializer, response_serializer, method, description
         ):
@@ -80,19 +91,17 @@ def _get_schema_decorator():
                 and request_serializer._declared_fields
             )
 
-            # 构建 extend_schema 参数
-            kwargs = {
-                "responses": {200: response_serializer}
-                if response_serializer and response_serializer is not Serializer
-                else None,
-                "description": desc_str,
-            }
+            # 构建 extend_schema 参数，仅写入有效的参数项
+            kwargs = {"description": desc_str}
+
+            if response_serializer and response_serializer is not Serializer:
+                kwargs["responses"] = {200: response_serializer}
 
             # 非 GET 请求：添加 request body
             if method != "GET" and has_request_fields:
                 kwargs["request"] = request_serializer
 
-            return extend_schema(**{k: v for k, v in kwargs.items() if v is not None})
+            return extend_schema(**kwargs)
 
         _schema_decorator_func = spectacular_decorator
         return _schema_decorator_func
@@ -100,14 +109,61 @@ def _get_schema_decorator():
         pass
 
     # 无可用的文档库，返回空装饰器
-    def _noop_decorator(request_serializer, response_serializer, method, description):
-        """空装饰器，不生成文档"""
-        return lambda f: f
-
     _schema_decorator_func = _noop_decorator
     return _schema_decorator_func
 
 
+def _private_no_cache(view_func):
+    """
+    为视图响应添加 Cache-Control: max-age=0, private
+
+    与 method_decorator(cache_control(max_age=0, private=True)) 效果一致，
+    但只增加一层调用栈
+    """
+
+    @functools.wraps(view_func)
+    def wrapper(self, request, *args, **kwargs):
+        response = view_func(self, request, *args, **kwargs)
+        patch_cache_control(response, max_age=0, private=True)
+        return response
+
+    return wrapper
+
+
+def _mark_as_action(view_func, resource_route):
+    """
+    将视图函数标记为 DRF 自定义 action 端点
+
+    直接写入 @action 装饰器设置的属性（mapping/detail/url_path/url_name/kwargs），
+    省去每个路由构造 action 参数与装饰器闭包的开销
+    """
+    view_func.mapping = MethodMapper(view_func, [resource_route.method.lower()])
+    # 是否为详情路由 (URL 是否含主键)
+    view_func.detail = bool(resource_route.pk_field)
+    view_func.url_path = resource_route.url_path
+    view_func.url_name = resource_route.url_name
+    # 与 @action 一致：作为 as_view() 的初始化参数，供 DRF 生成视图名称与描述
+    view_func.kwargs = {
+        "name": pretty_name(view_func.__name__),
+        "description": view_func.__doc__ or None,
+    }
+    return view_func
+
+
+def _copy_query_params(request):
+    """获取 GET 请求参数的可修改副本"""
+    return request.query_params.copy()
+
+
+def _content_encoding_setter(content_encoding):
+    """生成设置响应内容编码的回调"""
+
+    def set_content_encoding(response):
+        response.content_encoding = content_encoding
+
+    return set_content_encoding
+
+
 class ResourceRoute:
     """
     Resource的视图配置，应用于viewsets
@@ -122,6 +178,7 @@ class ResourceRoute:
         enable_paginate=False,
         content_encoding=None,
         decorators=None,
+        allow_async=True,
     ):
         """
         :param method: 请求方法，目前仅支持GET和POST
@@ -131,6 +188,7 @@ class ResourceRoute:
         :param enable_paginate: 是否对结果进行分页
         :param content_encoding: 返回数据内容编码类型
         :params decorators: 给view_func添加的装饰器列表
+        :param allow_async: 是否支持通过 X-Async-Task 请求头以异步任务方式执行
         """
         # if method.upper() not in ["GET", "POST"]:
         #     raise ValueError(_("method参数错误，目前仅支持GET或POST方法"))
@@ -152,8 +210,16 @@ class ResourceRoute:
 
         self.resource_class = resource_class
 
+        # 兼容 endpoint=None 的写法，与空字符串一样表示 list/create 等标准方法
+        endpoint = endpoint or ""
         self.endpoint = endpoint
 
+        # action 端点的 url 配置与视图函数名在初始化时一次性确定
+        # （特殊处理 "detail" 避免与 DRF 内置名称冲突）
+        self.url_path = endpoint
+        self.url_name = endpoint.replace("_", "-")
+        self.func_name = f"api_func_{endpoint}" if endpoint == "detail" else endpoint
+
         self.enable_paginate = enable_paginate
 
         self.content_encoding = content_encoding
@@ -162,6 +228,90 @@ class ResourceRoute:
 
         self.decorators = decorators
 
+        self.allow_async = allow_async
+
+        # 响应构建后依次执行的回调，按路由配置在初始化时生成
+        response_post = []
+        if content_encoding:
+            response_post.append(_content_encoding_setter(content_encoding))
+        self.response_post = tuple(response_post)
+
+        # 请求参数获取方式在初始化时确定，视图处理请求时直接调用
+        if self.method != "GET":
+            self.param_getter = operator.attrgetter("data")
+        elif (
+            not pk_field
+            and resource_class._search_serializer_class()[0]
+            and resource_class.request is Resource.request
+            and resource_class.validate_request_data is Resource.validate_request_data
+        ):
+            # 有 RequestSerializer 且未重写参数处理方法时，校验后返回的是新的
+            # validated_data，原始 query_params 不会被修改，无需 copy
+            self.param_getter = operator.attrgetter("query_params")
+        else:
+            # 需要写入主键、无 RequestSerializer 时参数原样传给 perform_request，
+            # 或子类重写的 request/validate_request_data 可能修改参数，需保留可修改的副本
+            self.param_getter = _copy_query_params
+
+
+def _ensure_serializer_meta(serializer_class):
+    """
+    如果 serializer_class 没有 Meta 属性，则添加 Meta 属性（ref_name=None）
+    """
+    if not getattr(serializer_class, "Meta", None):
+
+        class Meta:
+            ref_name = None
+
+        serializer_class.Meta = Meta
+    return serializer_class
+
+
+class ResourceMapping(dict):
+    """
+    ViewSet 路由到 Resource 类的映射表
+
+    与旧版一致，以 (method, "view_set_path-action") 元组为 key 存储，
+    []、get、in、len()、迭代与 items() 等行为不变，key 在注册时一次性构建。
+
+    另按 view_set_path → action → method 维护嵌套索引，lookup 查询时
+    无需拼接字符串或构建元组 key。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._nested = {}
+
+    def register(self, view_set_path, action_name, method, resource_class):
+        self[(method, f"{view_set_path}-{action_name}")] = resource_class
+        self._nested.setdefault(view_set_path, {}).setdefault(action_name, {})[
+            method
+        ] = resource_class
+
+    def lookup(self, view_set_path, action_name, method, default=None):
+        """按 view_set_path、action、method 查询通过 register 注册的 Resource 类"""
+        try:
+            return self._nested[view_set_path][action_name][method]
+        except KeyError:
+            return default
+
+
+# 保护待应用 schema 装饰器列表的读取与清空
+_schema_lock = threading.Lock()
+
+
+class _DeferredSchema(DefaultSchema):
+    """
+    读取 ViewSet.schema 时先应用该 ViewSet 的 API 文档装饰器
+
+    schema 生成器枚举端点时会先读取 callback.cls.schema，处理请求时不会读取，
+    因此只有生成 API 文档的进程才会导入 drf-spectacular。
+    """
+
+    def __get__(self, instance, owner):
+        owner._apply_schema_decorators()
+        return super().__get__(instance, owner)
+
 
 class ResourceViewSet(viewsets.GenericViewSet):
     EMPTY_ENDPOINT_METHODS = {
@@ -176,28 +326,36 @@ class ResourceViewSet(viewsets.GenericViewSet):
     resource_routes: list[ResourceRoute] = []
     filter_backends = []
     pagination_class = None
-    resource_mapping = {}
+    resource_mapping = ResourceMapping()
+    # endpoint → RequestSerializer，由 generate_endpoint 按类构建
+    _action_serializers = {}
+    # 读取 schema 时才应用 API 文档装饰器，子类覆盖 schema 时在 generate_endpoint 中立即应用
+    schema = _DeferredSchema()
+
+    def initial(self, request, *args, **kwargs):
+        # 每个请求只在此处设置一次当前请求，Resource 通过 _current_request 读取
+        self._request_token = set_current_request(request)
+        super().initial(request, *args, **kwargs)
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            # 请求结束后还原当前请求，未安装 RequestProvider 中间件时
+            # 也不会遗留给同一线程后续处理的请求或后台任务
+            token = self.__dict__.pop("_request_token", None)
+            if token is not None:
+                reset_current_request(token)
 
     def get_serializer_class(self):
         """
         获取序列化器
-        """
-        serializer_class = None
-        for route in self.resource_routes:
-            if self.action == route.endpoint:
-                serializer_class = route.resource_class.RequestSerializer
-                break
-
-        if not serializer_class:
-            serializer_class = Serializer
-
-        class Meta:
-            ref_name = None
-
-        # 如果serializer_class没有Meta属性，则添加Meta属性
-        if not getattr(serializer_class, "Meta", None):
-            serializer_class.Meta = Meta
 
+        endpoint 到序列化器的映射在 generate_endpoint 时预先构建
+        """
+        serializer_class = self._action_serializers.get(self.action)
+        if serializer_class is None:
+            serializer_class = _ensure_serializer_meta(Serializer)
         return serializer_class
 
     def get_queryset(self):
@@ -232,7 +390,7 @@ class ResourceViewSet(viewsets.GenericViewSet):
         │                    │                                       │               │
         │                    ▼                                       │               │
         │   ┌────────────────────────────────┐                       │               │
-        │   │ 步骤2: 配置 API 文档装饰器      │                       │               │
+        │   │ 步骤2: 记录 API 文档参数        │                       │               │
         │   └────────────────────────────────┘                       │               │
         │                    │                                       │               │
         │                    ▼                                       │               │
@@ -282,16 +440,33 @@ class ResourceViewSet(viewsets.GenericViewSet):
         │                                                                             │
         └─────────────────────────────────────────────────────────────────────────────┘
         """
+        # ========== 幂等保护：每个类只生成一次端点 ==========
+        # 路由重复注册（如多个 urls 注册同一 ViewSet）时直接跳过
+        # 注意：从 cls.__dict__ 读取，避免子类继承到父类的标记
+        if cls.__dict__.get("_endpoints_generated"):
+            return
+
         # ========== 获取 ViewSet 的完整模块路径 ==========
         # 用于构建 resource_mapping 的唯一标识 key
-        # 区分：cls 本身是 ResourceViewSet 子类 vs cls 是实例
-        if issubclass(cls, ResourceViewSet):
-            view_set_path = f"{cls.__module__}.{cls.__name__}"
-        else:
-            view_set_path = f"{type(cls).__module__}.{type(cls).__name__}"
+        view_set_path = f"{cls.__module__}.{cls.__name__}"
+
+        # 循环内复用的类属性
+        empty_endpoint_methods = cls.EMPTY_ENDPOINT_METHODS
+        resource_mapping = cls.resource_mapping
+
+        # 待应用 API 文档装饰器的视图函数
+        pending_schema_functions = []
+        # endpoint → RequestSerializer，供 get_serializer_class 直接查询
+        action_serializers = {}
 
         # ========== 遍历所有路由配置 ==========
         for resource_route in cls.resource_routes:
+            # 循环内多次使用的路由配置绑定为局部变量
+            resource_class = resource_route.resource_class
+            method = resource_route.method
+            endpoint = resource_route.endpoint
+            pk_field = resource_route.pk_field
+
             # ────────────────────────────────────────────────────────────────
             # 步骤1: 生成基础视图函数
             # ────────────────────────────────────────────────────────────────
@@ -299,26 +474,22 @@ class ResourceViewSet(viewsets.GenericViewSet):
             function = cls._generate_view_function(resource_route)
 
             # ────────────────────────────────────────────────────────────────
-            # 步骤2: 配置 API 文档装饰器（drf-spectacular）
+            # 步骤2: 记录 API 文档参数（drf-spectacular）
             # ────────────────────────────────────────────────────────────────
             # 获取请求序列化器类（用于文档展示请求参数结构）
-            request_serializer_class = (
-                resource_route.resource_class.RequestSerializer or Serializer
-            )
+            request_serializer_class = resource_class.RequestSerializer or Serializer
 
             # 获取响应序列化器类（用于文档展示响应数据结构）
-            response_serializer_class = (
-                resource_route.resource_class.ResponseSerializer or Serializer
-            )
+            response_serializer_class = resource_class.ResponseSerializer or Serializer
 
-            # 创建 schema 装饰器，自动生成 API 文档（使用 drf-spectacular）
+            # 仅记录 schema 参数，extend_schema 延迟到 schema 生成读取 ViewSet.schema 时
+            # 再应用，处理请求的进程无需导入 drf-spectacular
             # 注意：传入 serializer 类而不是实例
-            schema_decorator = _get_schema_decorator()
-            decorator_function = schema_decorator(
-                request_serializer=request_serializer_class,
-                response_serializer=response_serializer_class,
-                method=resource_route.method,
-                description=resource_route.resource_class.__doc__,
+            schema_args = (
+                request_serializer_class,
+                response_serializer_class,
+                method,
+                resource_class.__doc__,
             )
 
             # ────────────────────────────────────────────────────────────────
@@ -326,8 +497,11 @@ class ResourceViewSet(viewsets.GenericViewSet):
             # ────────────────────────────────────────────────────────────────
             # 如果配置了额外装饰器，按顺序依次包裹视图函数
             if resource_route.decorators:
-                for decorator in resource_route.decorators:
-                    function = decorator(function)
+                function = functools.reduce(
+                    lambda func, decorator: decorator(func),
+                    resource_route.decorators,
+                    function,
+                )
 
             # ────────────────────────────────────────────────────────────────
             # 步骤4: 将视图函数绑定到 ViewSet
@@ -336,140 +510,204 @@ class ResourceViewSet(viewsets.GenericViewSet):
             # 分支A: endpoint 为空 → 绑定为标准 RESTful 方法
             # 分支B: endpoint 非空 → 创建自定义 action 端点
             #
-            if not resource_route.endpoint:
+            if not endpoint:
+                # 标准方法名: GET→list, POST→create, PUT→update, ...
+                std_name = empty_endpoint_methods.get(method)
+
                 # ═══════════════════════════════════════════════════════════
                 # 分支A: 绑定标准 RESTful 方法 (list/create/retrieve/update/destroy)
                 # ═══════════════════════════════════════════════════════════
-                function = decorator_function(function)
-
                 # 根据 HTTP 方法 + pk_field 组合，映射到对应的标准方法
-                if resource_route.method == "GET":
-                    if resource_route.pk_field:
+                if method == "GET":
+                    if pk_field:
                         # GET + pk_field → retrieve (获取单个资源详情)
                         cls.retrieve = function
                     else:
                         # GET 无 pk_field → list (获取资源列表)
                         cls.list = function
 
-                elif resource_route.method == "POST":
+                elif method == "POST":
                     # POST 创建资源，不允许设置 pk_field
-                    if resource_route.pk_field:
+                    if pk_field:
                         raise AssertionError(
                             _(
                                 "当请求方法为 %s，且 endpoint 为空时，禁止设置 pk_field 参数"
                             )
-                            % resource_route.method
+                            % method
                         )
                     cls.create = function
 
-                elif resource_route.method in cls.EMPTY_ENDPOINT_METHODS:
+                elif std_name:
                     # PUT/PATCH/DELETE 必须指定 pk_field（需要知道操作哪个资源）
-                    if not resource_route.pk_field:
+                    if not pk_field:
                         raise AssertionError(
                             _(
                                 "当请求方法为 %s，且 endpoint 为空时，必须提供 pk_field 参数"
                             )
-                            % resource_route.method
+                            % method
                         )
                     # 从映射表获取方法名: PUT→update, PATCH→partial_update, DELETE→destroy
-                    setattr(
-                        cls, cls.EMPTY_ENDPOINT_METHODS[resource_route.method], function
-                    )
+                    setattr(cls, std_name, function)
 
                 else:
                     # 不支持的 HTTP 方法
                     raise AssertionError(
                         _("不支持的请求方法: %s，请确认resource_routes配置是否正确!")
-                        % resource_route.method
+                        % method
                     )
 
-                # 注册到映射表: key=(HTTP方法, "模块路径-方法名"), value=Resource类
-                cls.resource_mapping[
-                    (
-                        resource_route.method,
-                        f"{view_set_path}-{cls.EMPTY_ENDPOINT_METHODS[resource_route.method]}",
-                    )
-                ] = resource_route.resource_class
+                # 映射表 key=(模块路径, 方法名, HTTP方法)
+                resource_key = (view_set_path, std_name, method)
 
             else:
                 # ═══════════════════════════════════════════════════════════
                 # 分支B: 创建自定义 action 端点
                 # ═══════════════════════════════════════════════════════════
 
-                # 设置函数名（特殊处理 "detail" 避免与 DRF 内置名称冲突）
-                function.__name__ = (
-                    f"api_func_{resource_route.endpoint}"
-                    if resource_route.endpoint == "detail"
-                    else resource_route.endpoint
-                )
+                # 设置函数名
+                function.__name__ = resource_route.func_name
 
                 # 添加缓存控制: 禁用缓存 + 标记为私有响应
-                function = method_decorator(cache_control(max_age=0, private=True))(
-                    function
-                )
-
-                # 使用 DRF @action 装饰器注册为自定义端点
-                function = action(
-                    detail=bool(
-                        resource_route.pk_field
-                    ),  # 是否为详情路由 (URL 是否含主键)
-                    methods=[resource_route.method],  # 允许的 HTTP 方法
-                    url_path=resource_route.endpoint,  # URL 路径后缀
-                    url_name=resource_route.endpoint.replace(
-                        "_", "-"
-                    ),  # URL 名称 (下划线转中划线)
-                )(function)
+                function = _private_no_cache(function)
 
-                # 应用 API 文档装饰器
-                function = decorator_function(function)
+                # 注册为 DRF 自定义 action 端点（等价于 @action 装饰器）
+                function = _mark_as_action(function, resource_route)
 
                 # 将函数绑定到 ViewSet 类
                 setattr(cls, function.__name__, function)
 
-                # 注册到映射表: key=(HTTP方法, "模块路径-endpoint名称"), value=Resource类
-                cls.resource_mapping[
-                    (
-                        resource_route.method,
-                        f"{view_set_path}-{resource_route.endpoint}",
+                # 记录 endpoint 对应的序列化器（同名 endpoint 以首个路由为准）
+                if endpoint not in action_serializers:
+                    action_serializers[endpoint] = _ensure_serializer_meta(
+                        request_serializer_class
                     )
-                ] = resource_route.resource_class
+
+                # 映射表 key=(模块路径, endpoint名称, HTTP方法)
+                resource_key = (view_set_path, endpoint, method)
+
+            # ────────────────────────────────────────────────────────────────
+            # 步骤5: 注册到映射表
+            # ────────────────────────────────────────────────────────────────
+            # 视图函数在生成时已闭包绑定 Resource 类，请求处理时不查询 resource_mapping
+            resource_mapping.register(*resource_key, resource_class)
+
+            function._drf_resource_schema_args = schema_args
+            pending_schema_functions.append(function)
+
+        cls._pending_schema_functions = pending_schema_functions
+        cls._action_serializers = action_serializers
+        # 全部路由处理成功后才标记，配置错误抛出异常时不会留下半初始化的标记
+        cls._endpoints_generated = True
+
+        # 自定义了 schema（如 AutoSchema 子类）的 ViewSet 不会经过 _DeferredSchema，
+        # 无法延迟到 schema 生成时，因此立即应用
+        if not isinstance(inspect.getattr_static(cls, "schema", None), _DeferredSchema):
+            cls._apply_schema_decorators()
+
+    @classmethod
+    def _apply_schema_decorators(cls):
+        """
+        为 generate_endpoint 生成的视图函数应用 API 文档装饰器
+
+        extend_schema 作用于函数时只会在函数上挂载 schema 信息并返回原函数，
+        因此可以在函数绑定到 ViewSet 之后再补充应用。
+        """
+        if not cls.__dict__.get("_pending_schema_functions"):
+            return
+
+        # 加锁后再次检查，保证并发读取 schema 时每个函数只应用一次装饰器
+        with _schema_lock:
+            pending_schema_functions = cls.__dict__.get("_pending_schema_functions")
+            if not pending_schema_functions:
+                return
+
+            schema_decorator = _get_schema_decorator()
+            for function in pending_schema_functions:
+                request_serializer, response_serializer, method, description = (
+                    function._drf_resource_schema_args
+                )
+                schema_decorator(
+                    request_serializer=request_serializer,
+                    response_serializer=response_serializer,
+                    method=method,
+                    description=description,
+                )(function)
+            # 全部应用完成后再清空，其他线程在此之前会等待锁
+            cls._pending_schema_functions = []
 
     @classmethod
     def _generate_view_function(cls, resource_route: ResourceRoute):
         """
         生成方法模版
+
+        resource_route 在注册时已固定，因此请求参数获取方式、分页等配置分支
+        在生成视图时一次性确定，请求处理时不再重复判断。
         """
+        resource_class = resource_route.resource_class
+        pk_field = resource_route.pk_field
+        response_post = resource_route.response_post
+        allow_async = resource_route.allow_async
+        # 在生成视图时固定 lookup_field，避免每次请求都沿 MRO 查找类属性
+        lookup_field = cls.lookup_field
+
+        # ========== 请求参数获取 ==========
+        param_getter = resource_route.param_getter
+
+        # ========== resource 实例 ==========
+        if resource_class.reuse_instance:
+            # 声明可复用的 resource 在生成视图时实例化一次，省去每次请求的构造开销
+            shared_resource = resource_class()
+
+            def get_resource(args, kwargs):
+                # url 参数需要作为 context 传给 resource，此时仍按请求实例化
+                if args or kwargs:
+                    return resource_class(*args, **kwargs)
+                return shared_resource
 
-        def view(self, request, *args, **kwargs):
-            resource = resource_route.resource_class(*args, **kwargs)
-            params = (
-                request.query_params.copy()
-                if resource_route.method == "GET"
-                else request.data
-            )
-            local.current_request = request
-            resource._current_request = request
+        else:
 
-            if resource_route.pk_field:
-                # 如果是detail route，需要重url参数中获取主键，并塞到请求参数中
-                params.update({resource_route.pk_field: kwargs[cls.lookup_field]})
+            def get_resource(args, kwargs):
+                return resource_class(*args, **kwargs)
 
-            is_async_task = "HTTP_X_ASYNC_TASK" in request.META
-            if is_async_task:
+        # ========== 响应构建 ==========
+        if resource_route.enable_paginate:
+
+            def build_response(view_set, data):
+                page = view_set.paginate_queryset(data)
+                return view_set.get_paginated_response(page)
+
+        else:
+
+            def build_response(view_set, data, _Response=Response):
+                return _Response(data)
+
+        # 模块级名称以仅限关键字的默认参数绑定，请求处理时按局部变量读取
+        def view(
+            self,
+            request,
+            *args,
+            _Response=Response,
+            _HttpResponse=HttpResponse,
+            **kwargs,
+        ):
+            resource = get_resource(args, kwargs)
+            params = param_getter(request)
+            if pk_field:
+                # detail route 需要从 url 参数中获取主键，并塞到请求参数中
+                params.update({pk_field: kwargs[lookup_field]})
+
+            # 不支持异步的路由无需检查请求头
+            if allow_async and "HTTP_X_ASYNC_TASK" in request.META:
                 # 执行异步任务
                 data = resource.delay(params)
-                response = Response(data)
+                response = _Response(data)
             else:
                 data = resource.request(params)
-                if isinstance(data, HttpResponse):
+                if isinstance(data, _HttpResponse):
                     return data
-                if resource_route.enable_paginate:
-                    page = self.paginate_queryset(data)
-                    response = self.get_paginated_response(page)
-                else:
-                    response = Response(data)
-            if resource_route.content_encoding:
-                response.content_encoding = resource_route.content_encoding
+                response = build_response(self, data)
+            for callback in response_post:
+                callback(response)
             return response
 
         view.__name__ = resource_route.endpoint
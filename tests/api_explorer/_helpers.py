@@ -0,0 +1,34 @@
+"""
+Tencent is pleased to support the open source community by making 蓝鲸智云 - 监控平台 (BlueKing - Monitor) available.
+Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://opensource.org/licenses/MIT
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+"""
+
+import json
+
+from drf_resource.api_explorer.exceptions import ResourceNotFoundError
+
+# api_invoke 请求体在模块加载时序列化一次，各测试直接复用
+INVOKE_BODY = json.dumps({"module": "test", "api_name": "test"})
+
+# 服务层替身抛出的异常实例，各测试共用
+SERVICE_ERROR = Exception("Service error")
+NOT_FOUND_ERROR = ResourceNotFoundError("API not found")
+
+
+def fake_service(result=None, error=None, calls=None):
+    """构造替身函数：记录调用参数到 calls，抛出 error 或返回 result"""
+
+    def fake(*args, **kwargs):
+        if calls is not None:
+            calls.append((args, kwargs))
+        if error is not None:
+            # 共用的异常实例每次抛出前清掉上次的 traceback，避免帧引用逐次累积
+            raise error.with_traceback(None)
+        return result
+
+    return fake
@@ -8,86 +8,31 @@ an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express o
 specific language governing permissions and limitations under the License.
 """
 
-import os
+import functools
+from types import SimpleNamespace
 
-# 第一步：清除环境变量，避免 .env 文件干扰
-os.environ.pop("DJANGO_SETTINGS_MODULE", None)
-os.environ.pop("DJANGO_CONF_MODULE", None)
-
-# 第二步：在任何其他导入之前配置 Django
-import django
-from django.conf import settings
-
-if not settings.configured:
-    settings.configure(
-        DEBUG=True,
-        SECRET_KEY="test-secret-key",
-        ALLOWED_HOSTS=["testserver", "localhost", "127.0.0.1"],
-        INSTALLED_APPS=[
-            "django.contrib.contenttypes",
-            "django.contrib.auth",
-            "rest_framework",
-            # 注意：不加载 drf_resource app，避免触发 ResourceFinder
-        ],
-        DATABASES={
-            "default": {
-                "ENGINE": "django.db.backends.sqlite3",
-                "NAME": ":memory:",
-            }
-        },
-        REST_FRAMEWORK={
-            "TEST_REQUEST_DEFAULT_FORMAT": "json",
-            "DEFAULT_RENDERER_CLASSES": [
-                "drf_resource.response.ResourceJSONRenderer",
-            ],
-            "EXCEPTION_HANDLER": "drf_resource.exceptions.handlers.resource_exception_handler",
-        },
-        CACHES={
-            "default": {
-                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-            }
-        },
-        # drf_resource 需要的配置
-        BASE_DIR=os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        ),
-        API_DIR="api",
-        PLATFORM="community",
-        ROLE="web",
-        APP_CODE="test_app",
-        ROOT_URLCONF="tests.api_explorer.urls",  # 测试用 URL 配置
-        DRF_RESOURCE={
-            "API_EXPLORER_ENABLED": True,
-        },
-    )
-    django.setup()
-
-# 第三步：现在可以安全导入 pytest 和其他模块
 import pytest
+from django.conf import settings
 
-from rest_framework.serializers import CharField, Serializer
-from rest_framework.test import APIClient
-
-# 延迟导入 drf_resource，在 fixture 中按需导入
-
-
-class MockRequestSerializer(Serializer):
-    """Mock 请求序列化器"""
 
-    name = CharField(required=True, max_length=100)
-    value = CharField(required=False, default="default_value")
+@functools.lru_cache(maxsize=1)
+def create_mock_resource_class():
+    """创建 Mock Resource 类"""
+    from rest_framework.serializers import CharField, Serializer
 
+    from drf_resource.resources.base import Resource
 
-class MockResponseSerializer(Serializer):
-    """Mock 响应序列化器"""
+    class MockRequestSerializer(Serializer):
+        """Mock 请求序列化器"""
 
-    result = CharField()
-    data = CharField()
+        name = CharField(required=True, max_length=100)
+        value = CharField(required=False, default="default_value")
 
+    class MockResponseSerializer(Serializer):
+        """Mock 响应序列化器"""
 
-def create_mock_resource_class():
-    """创建 Mock Resource 类"""
-    from drf_resource.resources.base import Resource
+        result = CharField()
+        data = CharField()
 
     class MockResource(Resource):
         """Mock Resource 类"""
@@ -109,6 +54,7 @@ def create_mock_resource_class():
     return MockResource
 
 
+@functools.lru_cache(maxsize=1)
 def create_mock_fail_resource_class():
     """创建 Mock 失败的 Resource 类"""
     from drf_resource.resources.base import Resource
@@ -122,6 +68,7 @@ def create_mock_fail_resource_class():
     return MockFailResource
 
 
+@functools.lru_cache(maxsize=1)
 def create_mock_api_shortcut_class():
     """创建 Mock APIResourceShortcut 类"""
 
@@ -139,7 +86,11 @@ def create_mock_api_shortcut_class():
 
         def __getattr__(self, item):
             if item in self._methods:
-                return self._methods[item]()
+                # 与真实 ResourceShortcut 一致，每个接口只实例化一次；
+                # 写入实例属性后，后续访问不再经过 __getattr__
+                instance = self._methods[item]()
+                self.__dict__[item] = instance
+                return instance
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{item}'"
             )
@@ -150,128 +101,163 @@ def create_mock_api_shortcut_class():
     return MockAPIResourceShortcut
 
 
-@pytest.fixture
-def api_client():
-    """API 客户端 fixture"""
+@pytest.fixture(scope="session")
+def _session_api_client():
+    """整个会话共用的 APIClient 实例"""
+    from rest_framework.test import APIClient
+
     return APIClient()
 
 
+@pytest.fixture(scope="session")
+def api_factory():
+    """整个会话共用的 APIRequestFactory 实例"""
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@functools.cache
+def _get_view(method, endpoint):
+    """构造只映射单个动作的视图函数，按 (method, endpoint) 缓存"""
+    from drf_resource.api_explorer.views import ApiHomeResourceViewSet
+
+    ApiHomeResourceViewSet.generate_endpoint()
+    return ApiHomeResourceViewSet.as_view({method: endpoint})
+
+
 @pytest.fixture
+def call_view(api_factory):
+    """
+    绕过中间件与 URL 解析，直接调用 ApiHomeResourceViewSet 的动作，返回渲染后的响应
+
+    权限类仍会执行；需要完整请求链路的用例继续使用 api_client。
+    """
+    from rest_framework.test import force_authenticate
+
+    def call(method, endpoint, data=None, user=None):
+        path = f"/api-explorer/{endpoint}/"
+        if method == "post":
+            request = api_factory.post(path, data, content_type="application/json")
+        else:
+            request = api_factory.get(path, data)
+        if user is not None:
+            force_authenticate(request, user=user)
+        return _get_view(method, endpoint)(request).render()
+
+    return call
+
+
+@pytest.fixture
+def api_client(_session_api_client):
+    """API 客户端 fixture，复用会话级实例，测试结束后重置请求凭证与 cookie"""
+    yield _session_api_client
+    # 不调用 logout()：测试配置未安装 django.contrib.sessions
+    _session_api_client.credentials()
+    _session_api_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def fake_user():
+    """已认证的轻量用户对象，配合 force_authenticate 使用"""
+    return SimpleNamespace(
+        username="test_user", is_authenticated=True, is_active=True, pk=1
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_resource_class():
     """Mock Resource 类 fixture"""
     return create_mock_resource_class()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_fail_resource_class():
     """Mock 失败的 Resource 类 fixture"""
     return create_mock_fail_resource_class()
 
 
-@pytest.fixture
-def mock_api_module(monkeypatch):
-    """Mock API 模块 fixture"""
+@pytest.fixture(scope="session")
+def permission_ctx():
+    """权限检查上下文 fixture：(permission, request, view, obj)，整个会话复用"""
+    from unittest.mock import Mock
+
+    from drf_resource.api_explorer.permissions import IsTestEnvironment
+
+    return IsTestEnvironment(), Mock(), Mock(), Mock()
+
+
+@pytest.fixture(scope="session")
+def mock_api_module():
+    """Mock API 模块 fixture（只读，整个会话复用）"""
     MockAPIResourceShortcut = create_mock_api_shortcut_class()
-    MockResource = create_mock_resource_class()
-    MockFailResource = create_mock_fail_resource_class()
 
     # 创建 mock 模块
     mock_module = MockAPIResourceShortcut(
         "api.mock_module",
-        methods={"test_api": MockResource, "fail_api": MockFailResource},
+        methods={
+            "test_api": create_mock_resource_class(),
+            "fail_api": create_mock_fail_resource_class(),
+        },
     )
 
-    # 使用 monkeypatch 直接设置 api 对象的属性
     from drf_resource.management import root
 
-    # 直接在 api 对象上设置 mock_module 属性
-    monkeypatch.setattr(root.api, "mock_module", mock_module, raising=False)
-
-    return mock_module
+    # 直接在 api 对象上设置 mock_module 属性，会话结束后自动恢复
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(root.api, "mock_module", mock_module, raising=False)
+        yield mock_module
 
 
 @pytest.fixture
 def mock_settings_api_explorer_enabled(monkeypatch):
     """Mock settings.DRF_RESOURCE['API_EXPLORER_ENABLED'] = True"""
-    try:
-        from django.conf import settings
+    if not hasattr(settings, "DRF_RESOURCE"):
+        monkeypatch.setattr(settings, "DRF_RESOURCE", {}, raising=False)
 
-        if not hasattr(settings, "DRF_RESOURCE"):
-            monkeypatch.setattr(settings, "DRF_RESOURCE", {})
-
-        settings.DRF_RESOURCE["API_EXPLORER_ENABLED"] = True
-        yield
-        # 清理
-        if (
-            hasattr(settings, "DRF_RESOURCE")
-            and "API_EXPLORER_ENABLED" in settings.DRF_RESOURCE
-        ):
-            del settings.DRF_RESOURCE["API_EXPLORER_ENABLED"]
-    except ImportError:
-        # Django未安装时跳过
-        yield
+    # monkeypatch 在测试结束后自动恢复原值
+    monkeypatch.setitem(settings.DRF_RESOURCE, "API_EXPLORER_ENABLED", True)
+    yield
 
 
 @pytest.fixture
 def mock_settings_api_explorer_disabled(monkeypatch):
     """Mock settings.DRF_RESOURCE['API_EXPLORER_ENABLED'] = False"""
-    try:
-        from django.conf import settings
-
-        if not hasattr(settings, "DRF_RESOURCE"):
-            monkeypatch.setattr(settings, "DRF_RESOURCE", {})
-
-        settings.DRF_RESOURCE["API_EXPLORER_ENABLED"] = False
-        yield
-        # 清理
-        if (
-            hasattr(settings, "DRF_RESOURCE")
-            and "API_EXPLORER_ENABLED" in settings.DRF_RESOURCE
-        ):
-            del settings.DRF_RESOURCE["API_EXPLORER_ENABLED"]
-    except ImportError:
-        # Django未安装时跳过
-        yield
+    if not hasattr(settings, "DRF_RESOURCE"):
+        monkeypatch.setattr(settings, "DRF_RESOURCE", {}, raising=False)
 
-
-@pytest.fixture
-def mock_debug_mode(monkeypatch):
-    """Mock DEBUG=True"""
-    try:
-        from django.conf import settings
-
-        monkeypatch.setattr(settings, "DEBUG", True)
-    except ImportError:
-        pass
+    # monkeypatch 在测试结束后自动恢复原值
+    monkeypatch.setitem(settings.DRF_RESOURCE, "API_EXPLORER_ENABLED", False)
     yield
 
 
 @pytest.fixture
-def mock_production_mode(monkeypatch):
-    """Mock 生产环境（DEBUG=False，无 DRF_RESOURCE 配置）"""
-    try:
-        from django.conf import settings
-
-        monkeypatch.setattr(settings, "DEBUG", False)
-
-        # 确保没有显式配置
-        if hasattr(settings, "DRF_RESOURCE"):
-            if "API_EXPLORER_ENABLED" in settings.DRF_RESOURCE:
-                del settings.DRF_RESOURCE["API_EXPLORER_ENABLED"]
-    except ImportError:
-        pass
-    yield
-
-
-@pytest.fixture
-def mock_env_dev(monkeypatch):
-    """Mock ENV=dev"""
-    monkeypatch.setenv("ENV", "dev")
-    yield
-
-
-@pytest.fixture
-def mock_env_production(monkeypatch):
-    """Mock ENV=production"""
-    monkeypatch.setenv("ENV", "production")
-    yield
+def env_mode(request, monkeypatch):
+    """
+    Mock 运行环境，通过 indirect 参数化指定一个或多个模式（按顺序应用）
+
+    - debug: DEBUG=True
+    - production: 生产环境（DEBUG=False，无 DRF_RESOURCE 显式配置）
+    - env_<name>: 环境变量 ENV=<name>，如 env_dev、env_production
+
+    用法：@pytest.mark.parametrize("env_mode", [("production", "env_dev")], indirect=True)
+    """
+    modes = request.param
+    if isinstance(modes, str):
+        modes = (modes,)
+
+    for mode in modes:
+        if mode == "debug":
+            monkeypatch.setattr(settings, "DEBUG", True)
+        elif mode == "production":
+            monkeypatch.setattr(settings, "DEBUG", False)
+            # 确保没有显式配置
+            if hasattr(settings, "DRF_RESOURCE"):
+                monkeypatch.delitem(
+                    settings.DRF_RESOURCE, "API_EXPLORER_ENABLED", raising=False
+                )
+        elif mode.startswith("env_"):
+            monkeypatch.setenv("ENV", mode[len("env_") :])
+        else:
+            raise ValueError(f"未知的 env_mode: {mode}")
+    yield modes
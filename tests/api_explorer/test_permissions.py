@@ -8,9 +8,9 @@ an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express o
 specific language governing permissions and limitations under the License.
 """
 
-from unittest.mock import Mock
+import pytest
 
-from drf_resource.api_explorer.permissions import IsTestEnvironment, is_test_environment
+from drf_resource.api_explorer.permissions import is_test_environment
 
 
 class TestIsTestEnvironment:
@@ -20,42 +20,40 @@ class TestIsTestEnvironment:
         """测试显式启用 API Explorer"""
         assert is_test_environment() is True
 
-    def test_explicit_disabled(
-        self, mock_settings_api_explorer_disabled, mock_debug_mode
-    ):
+    @pytest.mark.parametrize("env_mode", ["debug"], indirect=True)
+    def test_explicit_disabled(self, mock_settings_api_explorer_disabled, env_mode):
         """测试显式禁用优先级高于 DEBUG 模式"""
         # 即使 DEBUG=True，显式禁用也会生效
         assert is_test_environment() is False
 
-    def test_debug_mode_enabled(self, mock_debug_mode):
+    @pytest.mark.parametrize("env_mode", ["debug"], indirect=True)
+    def test_debug_mode_enabled(self, env_mode):
         """测试 DEBUG 模式启用"""
         assert is_test_environment() is True
 
-    def test_debug_mode_disabled(self, mock_production_mode):
+    @pytest.mark.parametrize("env_mode", ["production"], indirect=True)
+    def test_debug_mode_disabled(self, env_mode):
         """测试生产环境（DEBUG=False）"""
         assert is_test_environment() is False
 
-    def test_env_dev(self, mock_production_mode, mock_env_dev):
-        """测试开发环境变量"""
-        assert is_test_environment() is True
-
-    def test_env_test(self, mock_production_mode, monkeypatch):
-        """测试测试环境变量"""
-        monkeypatch.setenv("ENV", "test")
-        assert is_test_environment() is True
-
-    def test_env_local(self, mock_production_mode, monkeypatch):
-        """测试本地环境变量"""
-        monkeypatch.setenv("ENV", "local")
-        assert is_test_environment() is True
-
-    def test_env_production(self, mock_production_mode, mock_env_production):
-        """测试生产环境变量"""
-        assert is_test_environment() is False
-
-    def test_priority_order(
-        self, mock_settings_api_explorer_disabled, mock_debug_mode, mock_env_dev
-    ):
+    @pytest.mark.parametrize(
+        "env_mode,expected",
+        [
+            # 开发/测试/本地环境变量视为测试环境
+            (("production", "env_dev"), True),
+            (("production", "env_test"), True),
+            (("production", "env_local"), True),
+            # 生产环境变量
+            (("production", "env_production"), False),
+        ],
+        indirect=["env_mode"],
+    )
+    def test_env(self, env_mode, expected):
+        """测试 ENV 环境变量"""
+        assert is_test_environment() is expected
+
+    @pytest.mark.parametrize("env_mode", [("debug", "env_dev")], indirect=True)
+    def test_priority_order(self, mock_settings_api_explorer_disabled, env_mode):
         """测试优先级顺序：显式配置 > DEBUG > ENV"""
         # 显式配置为 False，即使 DEBUG 和 ENV 都指向测试环境
         assert is_test_environment() is False
@@ -64,52 +62,48 @@ class TestIsTestEnvironment:
 class TestIsTestEnvironmentPermission:
     """测试 IsTestEnvironment 权限类"""
 
-    def test_has_permission_allowed(self, mock_settings_api_explorer_enabled):
+    def test_has_permission_allowed(
+        self, permission_ctx, mock_settings_api_explorer_enabled
+    ):
         """测试权限检查通过"""
-        permission = IsTestEnvironment()
-        mock_request = Mock()
-        mock_view = Mock()
+        permission, mock_request, mock_view, _ = permission_ctx
 
         assert permission.has_permission(mock_request, mock_view) is True
 
-    def test_has_permission_denied(self, mock_production_mode, mock_env_production):
+    @pytest.mark.parametrize(
+        "env_mode", [("production", "env_production")], indirect=True
+    )
+    def test_has_permission_denied(self, permission_ctx, env_mode):
         """测试权限检查不通过"""
-        permission = IsTestEnvironment()
-        mock_request = Mock()
-        mock_view = Mock()
+        permission, mock_request, mock_view, _ = permission_ctx
 
         assert permission.has_permission(mock_request, mock_view) is False
 
-    def test_has_object_permission_allowed(self, mock_settings_api_explorer_enabled):
+    def test_has_object_permission_allowed(
+        self, permission_ctx, mock_settings_api_explorer_enabled
+    ):
         """测试对象级权限检查通过"""
-        permission = IsTestEnvironment()
-        mock_request = Mock()
-        mock_view = Mock()
-        mock_obj = Mock()
+        permission, mock_request, mock_view, mock_obj = permission_ctx
 
         assert (
             permission.has_object_permission(mock_request, mock_view, mock_obj) is True
         )
 
-    def test_has_object_permission_denied(
-        self, mock_production_mode, mock_env_production
-    ):
+    @pytest.mark.parametrize(
+        "env_mode", [("production", "env_production")], indirect=True
+    )
+    def test_has_object_permission_denied(self, permission_ctx, env_mode):
         """测试对象级权限检查不通过"""
-        permission = IsTestEnvironment()
-        mock_request = Mock()
-        mock_view = Mock()
-        mock_obj = Mock()
+        permission, mock_request, mock_view, mock_obj = permission_ctx
 
         assert (
             permission.has_object_permission(mock_request, mock_view, mock_obj) is False
         )
 
-    def test_object_permission_consistency(self, mock_debug_mode):
+    @pytest.mark.parametrize("env_mode", ["debug"], indirect=True)
+    def test_object_permission_consistency(self, permission_ctx, env_mode):
         """测试对象级权限与普通权限的一致性"""
-        permission = IsTestEnvironment()
-        mock_request = Mock()
-        mock_view = Mock()
-        mock_obj = Mock()
+        permission, mock_request, mock_view, mock_obj = permission_ctx
 
         # 两个权限检查应该返回相同的结果
         has_perm = permission.has_permission(mock_request, mock_view)
@@ -9,11 +9,13 @@ specific language governing permissions and limitations under the License.
 """
 
 import pytest
-from unittest.mock import patch
 
 from drf_resource.api_explorer.exceptions import ResourceNotFoundError
 from drf_resource.api_explorer.services import APIDiscoveryService, APIInvokeService
 
+# 数值类型，供 isinstance 检查复用
+_NUMERIC = (int, float)
+
 
 class TestAPIDiscoveryService:
     """测试 APIDiscoveryService 服务"""
@@ -98,22 +100,21 @@ class TestAPIDiscoveryService:
         assert metadata["has_request_serializer"] is False
         assert metadata["has_response_serializer"] is False
 
-    def test_build_full_url(self):
+    @pytest.mark.parametrize(
+        "base_url,action,expected",
+        [
+            # 正常情况
+            ("http://example.com/api", "/test", "http://example.com/api/test"),
+            # 处理斜杠
+            ("http://example.com/api/", "test", "http://example.com/api/test"),
+            # 空值
+            ("", "/test", ""),
+            ("http://example.com", "", ""),
+        ],
+    )
+    def test_build_full_url(self, base_url, action, expected):
         """测试拼接完整 URL"""
-        # 正常情况
-        url = APIDiscoveryService._build_full_url("http://example.com/api", "/test")
-        assert url == "http://example.com/api/test"
-
-        # 处理斜杠
-        url = APIDiscoveryService._build_full_url("http://example.com/api/", "test")
-        assert url == "http://example.com/api/test"
-
-        # 空值
-        url = APIDiscoveryService._build_full_url("", "/test")
-        assert url == ""
-
-        url = APIDiscoveryService._build_full_url("http://example.com", "")
-        assert url == ""
+        assert APIDiscoveryService._build_full_url(base_url, action) == expected
 
     def test_match_search(self):
         """测试搜索匹配"""
@@ -135,50 +136,49 @@ class TestAPIDiscoveryService:
         # 不匹配
         assert not APIDiscoveryService._match_search(metadata, "nomatch")
 
-    def test_get_api_detail_success(self):
+    def test_get_api_detail_success(self, monkeypatch):
         """测试成功获取 API 详情"""
-        with patch.object(APIDiscoveryService, "get_api_detail") as mock_get_detail:
-            mock_get_detail.return_value = {
-                "module": "test_module",
-                "api_name": "test_api",
-                "class_name": "TestResource",
-                "label": "Test API",
-                "method": "GET",
-                "full_url": "http://example.com/api",
-                "request_params": [],
-                "response_params": [],
-            }
-
-            result = APIDiscoveryService.get_api_detail("test_module", "test_api")
-
-            assert result["module"] == "test_module"
-            assert result["api_name"] == "test_api"
-            assert "class_name" in result
-            assert "label" in result
-            assert "method" in result
-            assert "full_url" in result
-            assert "request_params" in result
-            assert "response_params" in result
+        detail = {
+            "module": "test_module",
+            "api_name": "test_api",
+            "class_name": "TestResource",
+            "label": "Test API",
+            "method": "GET",
+            "full_url": "http://example.com/api",
+            "request_params": [],
+            "response_params": [],
+        }
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "get_api_detail",
+            staticmethod(lambda module, api_name: detail),
+        )
+
+        result = APIDiscoveryService.get_api_detail("test_module", "test_api")
+
+        assert result["module"] == "test_module"
+        assert result["api_name"] == "test_api"
+        assert "class_name" in result
+        assert "label" in result
+        assert "method" in result
+        assert "full_url" in result
+        assert "request_params" in result
+        assert "response_params" in result
 
     def test_get_api_detail_module_not_found(self):
         """测试获取不存在模块的 API 详情"""
-        with pytest.raises(ResourceNotFoundError) as exc_info:
+        with pytest.raises(ResourceNotFoundError, match="模块不存在"):
             APIDiscoveryService.get_api_detail("nonexistent_module", "test_api")
-        assert "模块不存在" in str(exc_info.value)
 
     def test_get_api_detail_api_not_found(self):
         """测试获取不存在的 API 详情"""
-        with pytest.raises(ResourceNotFoundError) as exc_info:
+        # 验证错误消息包含相关信息
+        with pytest.raises(
+            ResourceNotFoundError, match=r"模块不存在|API 不存在|(?i:not found)"
+        ):
             APIDiscoveryService.get_api_detail(
                 "nonexistent_module_xyz", "nonexistent_api"
             )
-        # 验证错误消息包含相关信息
-        error_msg = str(exc_info.value)
-        assert (
-            "模块不存在" in error_msg
-            or "API 不存在" in error_msg
-            or "not found" in error_msg.lower()
-        )
 
 
 class TestAPIInvokeService:
@@ -248,25 +248,24 @@ class TestAPIInvokeService:
         assert result["success"] is False
         assert result["error_message"] is not None
 
-    def test_mask_sensitive_params(self):
+    @pytest.mark.parametrize(
+        "key,value,expected",
+        [
+            # 敏感字段应该被脱敏（长度 > 8 时保留前4后4）
+            ("password", "123456789", "1234***6789"),
+            ("bk_app_secret", "secret123456789", "secr***6789"),
+            # 使用 token_value 而不是 token
+            ("token_value", "abcdefghijk", "abcd***hijk"),
+            # 普通字段不受影响（使用不包含敏感词的键名）
+            ("normal_param", "normal_value", "normal_value"),
+            ("username", "test_user", "test_user"),
+        ],
+    )
+    def test_mask_sensitive_params(self, key, value, expected):
         """测试敏感参数脱敏"""
-        params = {
-            "username": "test_user",
-            "password": "123456789",  # 长度 > 8
-            "bk_app_secret": "secret123456789",
-            "token_value": "abcdefghijk",  # 使用 token_value 而不是 token
-            "normal_param": "normal_value",  # 使用不包含敏感词的键名
-        }
-
-        masked = APIInvokeService._mask_sensitive(params)
+        masked = APIInvokeService._mask_sensitive({key: value})
 
-        # 敏感字段应该被脱敏（长度 > 8 时保留前4后4）
-        assert masked["password"] == "1234***6789"
-        assert masked["bk_app_secret"] == "secr***6789"
-        assert masked["token_value"] == "abcd***hijk"
-        # 普通字段不受影响
-        assert masked["normal_param"] == "normal_value"
-        assert masked["username"] == "test_user"
+        assert masked == {key: expected}
 
     def test_mask_sensitive_short_values(self):
         """测试脱敏短值"""
@@ -292,7 +291,7 @@ class TestAPIInvokeService:
         )
 
         assert "duration" in result
-        assert isinstance(result["duration"], int | float)
+        assert isinstance(result["duration"], _NUMERIC)
         assert result["duration"] >= 0
 
     def test_invoke_records_timestamp(self, mock_api_module):
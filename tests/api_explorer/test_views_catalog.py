@@ -0,0 +1,99 @@
+"""
+Tencent is pleased to support the open source community by making 蓝鲸智云 - 监控平台 (BlueKing - Monitor) available.
+Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://opensource.org/licenses/MIT
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+"""
+
+import json
+
+from rest_framework import status
+
+from drf_resource.api_explorer.services import APIDiscoveryService
+from tests.api_explorer._helpers import SERVICE_ERROR, fake_service
+
+
+class TestCatalogView:
+    """测试 CatalogView（映射到 api_list 端点）"""
+
+    def test_get_catalog_success(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试成功获取 API 目录"""
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "discover_all_apis",
+            fake_service(result={"modules": [], "total": 0}),
+        )
+
+        response = call_view("get", "api_list")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = json.loads(response.content)
+        assert data["result"] is True
+        assert "modules" in data["data"]
+        assert "total" in data["data"]
+
+    def test_get_catalog_with_search(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试带搜索关键词获取目录"""
+        calls = []
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "discover_all_apis",
+            fake_service(calls=calls, result={"modules": [], "total": 0}),
+        )
+
+        response = call_view("get", "api_list", {"search": "test"})
+
+        assert response.status_code == status.HTTP_200_OK
+        # 验证 discover_all_apis 被调用时传入了 search 参数
+        assert calls == [((), {"search": "test", "module_filter": None})]
+
+    def test_get_catalog_with_module_filter(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试带模块过滤获取目录"""
+        calls = []
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "discover_all_apis",
+            fake_service(calls=calls, result={"modules": [], "total": 0}),
+        )
+
+        response = call_view("get", "api_list", {"module": "test_module"})
+
+        assert response.status_code == status.HTTP_200_OK
+        # 验证 discover_all_apis 被调用时传入了 module_filter 参数
+        assert calls == [((), {"search": None, "module_filter": "test_module"})]
+
+    def test_get_catalog_invalid_params(
+        self, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试无效参数（参数校验测试）"""
+        # 当前实现中 search 和 module 都是可选的，这里测试空字符串
+        response = call_view("get", "api_list", {"search": "", "module": ""})
+
+        # 应该成功，因为空字符串是允许的
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_get_catalog_service_error(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试服务层抛出异常"""
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "discover_all_apis",
+            fake_service(error=SERVICE_ERROR),
+        )
+
+        response = call_view("get", "api_list")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        data = json.loads(response.content)
+        assert data["result"] is False
+        assert "message" in data
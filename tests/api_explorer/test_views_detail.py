@@ -0,0 +1,99 @@
+"""
+Tencent is pleased to support the open source community by making 蓝鲸智云 - 监控平台 (BlueKing - Monitor) available.
+Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://opensource.org/licenses/MIT
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+"""
+
+import json
+
+from rest_framework import status
+
+from drf_resource.api_explorer.services import APIDiscoveryService
+from tests.api_explorer._helpers import NOT_FOUND_ERROR, SERVICE_ERROR, fake_service
+
+
+class TestAPIDetailView:
+    """测试 APIDetailView"""
+
+    def test_get_api_detail_success(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试成功获取 API 详情"""
+        result = {
+            "module": "test_module",
+            "api_name": "test_api",
+            "label": "Test API",
+            "request_params": [],
+            "response_params": [],
+        }
+        monkeypatch.setattr(
+            APIDiscoveryService, "get_api_detail", fake_service(result=result)
+        )
+
+        response = call_view(
+            "get",
+            "api_detail",
+            {"module": "test_module", "api_name": "test_api"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = json.loads(response.content)
+        assert data["result"] is True
+        assert data["data"]["module"] == "test_module"
+        assert data["data"]["api_name"] == "test_api"
+
+    def test_get_api_detail_missing_params(
+        self, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试缺少必填参数"""
+        # 缺少 module
+        response = call_view("get", "api_detail", {"api_name": "test_api"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # 缺少 api_name
+        response = call_view("get", "api_detail", {"module": "test_module"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # 全部缺少
+        response = call_view("get", "api_detail")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_api_detail_not_found(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试获取不存在的 API"""
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "get_api_detail",
+            fake_service(error=NOT_FOUND_ERROR),
+        )
+
+        response = call_view(
+            "get", "api_detail", {"module": "test", "api_name": "test"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        data = json.loads(response.content)
+        assert data["result"] is False
+
+    def test_get_api_detail_service_error(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试服务层抛出异常"""
+        monkeypatch.setattr(
+            APIDiscoveryService,
+            "get_api_detail",
+            fake_service(error=SERVICE_ERROR),
+        )
+
+        response = call_view(
+            "get", "api_detail", {"module": "test", "api_name": "test"}
+        )
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        data = json.loads(response.content)
+        assert data["result"] is False
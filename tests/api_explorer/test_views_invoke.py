@@ -0,0 +1,169 @@
+"""
+Tencent is pleased to support the open source community by making 蓝鲸智云 - 监控平台 (BlueKing - Monitor) available.
+Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://opensource.org/licenses/MIT
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+"""
+
+import json
+
+from rest_framework import status
+
+from drf_resource.api_explorer.services import APIInvokeService
+from tests.api_explorer._helpers import (
+    INVOKE_BODY,
+    NOT_FOUND_ERROR,
+    SERVICE_ERROR,
+    fake_service,
+)
+
+_INVOKE_BODY_NO_PARAMS = json.dumps({"module": "test_module", "api_name": "test_api"})
+_INVOKE_BODY_WITH_PARAMS = json.dumps(
+    {"module": "test_module", "api_name": "test_api", "params": {"key": "value"}}
+)
+_INVOKE_BODY_MISSING_MODULE = json.dumps({"api_name": "test_api"})
+_INVOKE_BODY_MISSING_API_NAME = json.dumps({"module": "test_module"})
+
+
+class TestInvokeView:
+    """测试 InvokeView（映射到 api_invoke 端点）"""
+
+    def test_invoke_api_success(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试成功调用 API"""
+        result = {
+            "success": True,
+            "response": {"result": "ok"},
+            "duration": 0.5,
+            "timestamp": "2026-01-12T10:00:00",
+        }
+        monkeypatch.setattr(APIInvokeService, "invoke_api", fake_service(result=result))
+
+        response = call_view("post", "api_invoke", _INVOKE_BODY_WITH_PARAMS)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = json.loads(response.content)
+        assert data["result"] is True
+        assert "data" in data
+
+    def test_invoke_api_with_empty_params(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试不传参数调用 API"""
+        calls = []
+        monkeypatch.setattr(
+            APIInvokeService,
+            "invoke_api",
+            fake_service(calls=calls, result={"success": True, "response": {}}),
+        )
+
+        response = call_view("post", "api_invoke", _INVOKE_BODY_NO_PARAMS)
+
+        assert response.status_code == status.HTTP_200_OK
+        # 验证调用时传入了空字典
+        args, _ = calls[-1]
+        assert args[2] == {}
+
+    def test_invoke_api_missing_params(
+        self, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试缺少必填参数"""
+        # 缺少 module
+        response = call_view("post", "api_invoke", _INVOKE_BODY_MISSING_MODULE)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # 缺少 api_name
+        response = call_view("post", "api_invoke", _INVOKE_BODY_MISSING_API_NAME)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invoke_api_not_found(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试调用不存在的 API"""
+        monkeypatch.setattr(
+            APIInvokeService,
+            "invoke_api",
+            fake_service(error=NOT_FOUND_ERROR),
+        )
+
+        response = call_view("post", "api_invoke", INVOKE_BODY)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        data = json.loads(response.content)
+        assert data["result"] is False
+
+    def test_invoke_api_failure(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试 API 调用失败"""
+        result = {
+            "success": False,
+            "error_message": "API call failed",
+            "response": None,
+        }
+        monkeypatch.setattr(APIInvokeService, "invoke_api", fake_service(result=result))
+
+        response = call_view("post", "api_invoke", INVOKE_BODY)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = json.loads(response.content)
+        # 顶层 result 是 True（HTTP 200），实际业务结果在 data 字段中
+        assert data["result"] is True
+        assert data["data"]["success"] is False
+
+    def test_invoke_api_service_error(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试服务层抛出异常"""
+        monkeypatch.setattr(
+            APIInvokeService,
+            "invoke_api",
+            fake_service(error=SERVICE_ERROR),
+        )
+
+        response = call_view("post", "api_invoke", INVOKE_BODY)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        data = json.loads(response.content)
+        assert data["result"] is False
+
+    def test_invoke_api_extracts_username(
+        self, monkeypatch, call_view, fake_user, mock_settings_api_explorer_enabled
+    ):
+        """测试调用时提取用户名"""
+        calls = []
+        monkeypatch.setattr(
+            APIInvokeService,
+            "invoke_api",
+            fake_service(calls=calls, result={"success": True, "response": {}}),
+        )
+
+        response = call_view("post", "api_invoke", INVOKE_BODY, user=fake_user)
+
+        assert response.status_code == status.HTTP_200_OK
+        # 验证 username 被传递
+        args, _ = calls[-1]
+        assert args[3] == "test_user"
+
+    def test_invoke_api_anonymous_user(
+        self, monkeypatch, call_view, mock_settings_api_explorer_enabled
+    ):
+        """测试匿名请求的 request.user 为 AnonymousUser，传递其用户名"""
+        from django.contrib.auth.models import AnonymousUser
+
+        calls = []
+        monkeypatch.setattr(
+            APIInvokeService,
+            "invoke_api",
+            fake_service(calls=calls, result={"success": True, "response": {}}),
+        )
+
+        response = call_view("post", "api_invoke", INVOKE_BODY)
+
+        assert response.status_code == status.HTTP_200_OK
+        args, _ = calls[-1]
+        assert args[3] == AnonymousUser.username
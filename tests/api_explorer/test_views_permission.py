@@ -0,0 +1,49 @@
+"""
+Tencent is pleased to support the open source community by making 蓝鲸智云 - 监控平台 (BlueKing - Monitor) available.
+Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+You may obtain a copy of the License at http://opensource.org/licenses/MIT
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+"""
+
+import pytest
+from rest_framework import status
+
+from tests.api_explorer._helpers import INVOKE_BODY
+
+
+class TestPermissionDenied:
+    """测试生产环境下各端点拒绝访问"""
+
+    @pytest.mark.parametrize(
+        "env_mode", [("production", "env_production")], indirect=True
+    )
+    @pytest.mark.parametrize(
+        "method,url,payload",
+        [
+            ("get", "/api-explorer/", None),
+            ("get", "/api-explorer/api_list/", None),
+            (
+                "get",
+                "/api-explorer/api_detail/",
+                {"module": "test", "api_name": "test"},
+            ),
+            ("post", "/api-explorer/api_invoke/", INVOKE_BODY),
+        ],
+        ids=["home", "api_list", "api_detail", "api_invoke"],
+    )
+    def test_denied_in_production(self, api_client, env_mode, method, url, payload):
+        """生产环境访问应返回 403 或 404"""
+        if method == "post":
+            response = api_client.post(
+                url, data=payload, content_type="application/json"
+            )
+        else:
+            response = api_client.get(url, payload)
+
+        assert response.status_code in [
+            status.HTTP_403_FORBIDDEN,
+            status.HTTP_404_NOT_FOUND,
+        ]
@@ -1,6 +1,6 @@
 """
 tests 目录的 pytest conftest
-在导入其他模块之前配置 Django
+Django 由 pytest-django 按 tests/settings.py 初始化
 """
 
 import os
@@ -12,66 +12,3 @@ httpflex_path = os.path.join(
 )
 if httpflex_path not in sys.path:
     sys.path.insert(0, httpflex_path)
-
-# 清除环境变量，避免 .env 文件干扰
-os.environ.pop("DJANGO_SETTINGS_MODULE", None)
-os.environ.pop("DJANGO_CONF_MODULE", None)
-
-# 在任何其他导入之前配置 Django
-import django
-from django.conf import settings
-
-if not settings.configured:
-    settings.configure(
-        DEBUG=True,
-        SECRET_KEY="test-secret-key",
-        ALLOWED_HOSTS=["testserver", "localhost", "127.0.0.1"],
-        INSTALLED_APPS=[
-            "django.contrib.contenttypes",
-            "django.contrib.auth",
-            "rest_framework",
-        ],
-        DATABASES={
-            "default": {
-                "ENGINE": "django.db.backends.sqlite3",
-                "NAME": ":memory:",
-            }
-        },
-        REST_FRAMEWORK={
-            "TEST_REQUEST_DEFAULT_FORMAT": "json",
-            "DEFAULT_RENDERER_CLASSES": [
-                "drf_resource.response.ResourceJSONRenderer",
-            ],
-            "EXCEPTION_HANDLER": "drf_resource.exceptions.handlers.resource_exception_handler",
-        },
-        CACHES={
-            "default": {
-                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-            }
-        },
-        TEMPLATES=[
-            {
-                "BACKEND": "django.template.backends.django.DjangoTemplates",
-                "DIRS": [
-                    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "drf_resource", "templates"),
-                ],
-                "APP_DIRS": True,
-                "OPTIONS": {
-                    "context_processors": [
-                        "django.template.context_processors.debug",
-                        "django.template.context_processors.request",
-                    ],
-                },
-            },
-        ],
-        BASE_DIR=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        API_DIR="api",
-        PLATFORM="community",
-        ROLE="web",
-        APP_CODE="test_app",
-        ROOT_URLCONF="tests.api_explorer.urls",
-        DRF_RESOURCE={
-            "API_EXPLORER_ENABLED": True,
-        },
-    )
-    django.setup()
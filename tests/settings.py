@@ -0,0 +1,69 @@
+"""
+测试用 Django 配置，由 pytest-django 通过 DJANGO_SETTINGS_MODULE 加载
+"""
+
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEBUG = True
+SECRET_KEY = "test-secret-key"
+ALLOWED_HOSTS = ["testserver", "localhost", "127.0.0.1"]
+
+# 保留 auth/contenttypes，匿名请求的 request.user 与线上一致为 AnonymousUser
+# 注意：不加载 drf_resource app，避免触发 ResourceFinder
+INSTALLED_APPS = [
+    "django.contrib.contenttypes",
+    "django.contrib.auth",
+    "rest_framework",
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+REST_FRAMEWORK = {
+    "TEST_REQUEST_DEFAULT_FORMAT": "json",
+    "DEFAULT_RENDERER_CLASSES": [
+        "drf_resource.response.ResourceJSONRenderer",
+    ],
+    "EXCEPTION_HANDLER": "drf_resource.exceptions.handlers.resource_exception_handler",
+}
+
+# 测试不验证缓存行为，使用不存储数据的 DummyCache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+}
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [
+            os.path.join(BASE_DIR, "drf_resource", "templates"),
+        ],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+            ],
+        },
+    },
+]
+
+# drf_resource 需要的配置
+API_DIR = "api"
+PLATFORM = "community"
+ROLE = "web"
+APP_CODE = "test_app"
+
+ROOT_URLCONF = "tests.api_explorer.urls"
+
+DRF_RESOURCE = {
+    "API_EXPLORER_ENABLED": True,
+}
@@ -3,13 +3,23 @@ APIResource 和 APICacheResource 单元测试
 """
 
 import pytest
-from unittest.mock import MagicMock
 from rest_framework import serializers
 
 from drf_resource.resources.api import APIResource, APICacheResource
 from drf_resource.exceptions import APIError
 
 
+def _const(value):
+    """返回固定值的替身函数，调用参数记录在 calls 上（list.append 线程安全，可用于 bulk_request）"""
+
+    def fake(*args, **kwargs):
+        fake.calls.append((args, kwargs))
+        return value
+
+    fake.calls = []
+    return fake
+
+
 # ========== 测试用的具体实现类 ==========
 
 
@@ -96,53 +106,32 @@ class TestAPIResourceInit:
 class TestAPIResourceRequest:
     """测试 APIResource 请求功能"""
 
-    def test_get_request(self):
-        """测试 GET 请求"""
-        resource = MockAPIResource()
+    @pytest.mark.parametrize(
+        "resource_cls,payload,expected",
+        [
+            (MockAPIResource, {"user_id": 123}, {"id": 1, "name": "test"}),
+            (
+                MockPostAPIResource,
+                {"name": "test", "email": "test@example.com"},
+                {"id": 1},
+            ),
+            (MockAPIResourceWithSerializer, {"user_id": 123}, {"id": 1}),
+        ],
+        ids=["get", "post", "with_serializer"],
+    )
+    def test_request(self, resource_cls, payload, expected):
+        """测试 GET/POST/带 RequestSerializer 的请求返回响应中的 data"""
+        resource = resource_cls()
 
         # Mock DRFClient 的内部方法，返回格式化后的响应
-        resource._make_request_and_format = MagicMock(
-            return_value={
-                "result": True,
-                "code": 200,
-                "message": "success",
-                "data": {"id": 1, "name": "test"},
-            }
+        resource._make_request_and_format = _const(
+            {"result": True, "code": 200, "message": "success", "data": expected}
         )
 
-        result = resource.request({"user_id": 123})
+        result = resource.request(payload)
 
-        assert result == {"id": 1, "name": "test"}
-        resource._make_request_and_format.assert_called_once()
-
-    def test_post_request(self):
-        """测试 POST 请求"""
-        resource = MockPostAPIResource()
-
-        resource._make_request_and_format = MagicMock(
-            return_value={
-                "result": True,
-                "code": 200,
-                "message": "success",
-                "data": {"id": 1},
-            }
-        )
-
-        result = resource.request({"name": "test", "email": "test@example.com"})
-
-        assert result == {"id": 1}
-
-    def test_request_with_serializer(self):
-        """测试带 RequestSerializer 的请求"""
-        resource = MockAPIResourceWithSerializer()
-
-        resource._make_request_and_format = MagicMock(
-            return_value={"result": True, "code": 200, "data": {"id": 1}}
-        )
-
-        result = resource.request({"user_id": 123})
-
-        assert result == {"id": 1}
+        assert result == expected
+        assert len(resource._make_request_and_format.calls) == 1
 
 
 class TestAPIResourceErrorHandling:
@@ -153,8 +142,8 @@ class TestAPIResourceErrorHandling:
         resource = MockAPIResource()
 
         # Mock 返回失败结果
-        resource._make_request_and_format = MagicMock(
-            return_value={
+        resource._make_request_and_format = _const(
+            {
                 "result": False,
                 "code": 500,
                 "message": "Internal error",
@@ -173,8 +162,8 @@ class TestAPIResourceErrorHandling:
         resource = MockAPIResource()
 
         # Mock 抛出超时异常
-        resource._make_request_and_format = MagicMock(
-            return_value={
+        resource._make_request_and_format = _const(
+            {
                 "result": False,
                 "code": -1,
                 "message": "Request timed out",
@@ -239,8 +228,8 @@ class TestAPICacheResource:
         """测试无缓存时正常请求"""
         resource = MockCacheAPIResource()
 
-        resource._make_request_and_format = MagicMock(
-            return_value={"result": True, "code": 200, "data": {"id": 1}}
+        resource._make_request_and_format = _const(
+            {"result": True, "code": 200, "data": {"id": 1}}
         )
 
         result = resource.request({})
@@ -260,8 +249,8 @@ class TestAPIResourceNonStandardFormat:
         resource = NonStandardResource()
 
         # 非标准格式时，响应格式化器会直接返回整个数据
-        resource._make_request_and_format = MagicMock(
-            return_value={
+        resource._make_request_and_format = _const(
+            {
                 "result": True,
                 "code": 200,
                 "message": "success",
@@ -301,9 +290,7 @@ class TestAPIError:
 
     def test_api_error_instantiation(self):
         """测试 APIError 实例化"""
-        from drf_resource.exceptions import APIError as APIErrorCls
-
-        error = APIErrorCls(
+        error = APIError(
             system_name="test_system",
             url="/api/test",
             result={"code": 500, "message": "Internal error"},
@@ -318,8 +305,8 @@ class TestBulkRequest:
         """测试批量请求"""
         resource = MockAPIResource()
 
-        resource._make_request_and_format = MagicMock(
-            return_value={"result": True, "code": 200, "data": {"id": 1}}
+        resource._make_request_and_format = _const(
+            {"result": True, "code": 200, "data": {"id": 1}}
         )
 
         results = resource.bulk_request(
@@ -331,3 +318,4 @@ class TestBulkRequest:
 
         assert len(results) == 2
         assert all(r == {"id": 1} for r in results)
+        assert len(resource._make_request_and_format.calls) == 2
@@ -0,0 +1,53 @@
+"""
+RequestProvider 中间件单元测试
+"""
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from drf_resource.middlewares.request import RequestProvider
+from drf_resource.utils.local import local
+from drf_resource.utils.request import get_request, set_current_request
+
+
+def _view(request):
+    """模拟同步视图：绑定当前请求并写入用户名"""
+    set_current_request(request)
+    local.username = "alice"
+    return HttpResponse()
+
+
+class TestRequestProvider:
+    """测试 RequestProvider 在请求结束后清理请求上下文"""
+
+    def test_sync_request_clears_local(self):
+        """测试 WSGI 下请求结束后 local 与当前请求被清空"""
+        seen = []
+
+        def get_response(request):
+            seen.append(get_request())
+            return _view(request)
+
+        request = RequestFactory().get("/")
+        RequestProvider(get_response)(request)
+
+        assert seen == [request]
+        assert not hasattr(local, "username")
+        assert get_request(peaceful=True) is None
+
+    def test_async_request_clears_local(self):
+        """测试 ASGI 下同步视图在共享线程写入的 local 在请求结束后被清空"""
+        seen = []
+
+        async def get_response(request):
+            seen.append(get_request())
+            return await sync_to_async(_view, thread_sensitive=True)(request)
+
+        request = RequestFactory().get("/")
+        # 从同步代码调用时，thread_sensitive 的同步函数回到当前线程执行
+        async_to_sync(RequestProvider(get_response))(request)
+
+        assert seen == [request]
+        assert not hasattr(local, "username")
+        assert get_request(peaceful=True) is None
@@ -0,0 +1,196 @@
+"""
+当前请求上下文（get_request / set_current_request）单元测试
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from drf_resource.resources.base import Resource
+from drf_resource.utils.local import current_request_var, local, with_request_local
+from drf_resource.utils.request import (
+    get_request,
+    reset_current_request,
+    set_current_request,
+)
+from drf_resource.views.viewsets import ResourceRoute, ResourceViewSet
+
+
+class EchoResource(Resource):
+    """回显请求参数"""
+
+    def perform_request(self, validated_request_data):
+        return validated_request_data
+
+
+class SeenRequestResource(Resource):
+    """记录处理时读取到的当前请求"""
+
+    seen = []
+
+    def perform_request(self, validated_request_data):
+        self.seen.append(self._current_request)
+        return {}
+
+
+class SeenRequestViewSet(ResourceViewSet):
+    resource_routes = [ResourceRoute("GET", SeenRequestResource)]
+
+
+@pytest.fixture(autouse=True)
+def clean_request_context():
+    """每个用例从空的请求上下文开始，结束后清理"""
+    token = current_request_var.set(None)
+    local.clear()
+    yield
+    local.clear()
+    current_request_var.reset(token)
+
+
+def _request(name):
+    return SimpleNamespace(name=name)
+
+
+class TestGetRequest:
+    """测试 get_request 的读取顺序"""
+
+    def test_no_request(self):
+        """测试没有当前请求时 peaceful 返回 None，否则抛出异常"""
+        assert get_request(peaceful=True) is None
+        with pytest.raises(Exception):
+            get_request()
+
+    def test_set_current_request(self):
+        """测试 set_current_request 同时写入 ContextVar 与 local"""
+        request = _request("alice")
+
+        set_current_request(request)
+
+        assert get_request() is request
+        assert current_request_var.get() is request
+        assert local.current_request is request
+
+    def test_context_var_takes_precedence(self):
+        """测试 ContextVar 中的请求优先于 local 中的请求"""
+        local.current_request = _request("local")
+        request = _request("context")
+        current_request_var.set(request)
+
+        assert get_request() is request
+
+    def test_fallback_to_local(self):
+        """测试 ContextVar 为空时回退到 local（如 ThreadPool 子线程继承的请求）"""
+        request = _request("local")
+        local.current_request = request
+
+        assert get_request() is request
+
+    def test_other_thread_isolated(self):
+        """测试其他线程读取不到当前线程的请求"""
+        set_current_request(_request("alice"))
+        result = []
+
+        thread = threading.Thread(target=lambda: result.append(get_request(True)))
+        thread.start()
+        thread.join()
+
+        assert result == [None]
+
+
+class TestResetCurrentRequest:
+    """测试 reset_current_request 还原设置前的请求"""
+
+    def test_reset_to_none(self):
+        """测试设置前没有请求时，还原后 ContextVar 与 local 中都没有请求"""
+        token = set_current_request(_request("alice"))
+
+        reset_current_request(token)
+
+        assert get_request(peaceful=True) is None
+        assert not hasattr(local, "current_request")
+
+    def test_reset_to_outer(self):
+        """测试还原为外层（如中间件）设置的请求"""
+        outer = _request("outer")
+        set_current_request(outer)
+        token = set_current_request(_request("inner"))
+
+        reset_current_request(token)
+
+        assert get_request() is outer
+        assert local.current_request is outer
+
+
+class TestViewSetRequestContext:
+    """测试未安装 RequestProvider 中间件时 ResourceViewSet 的请求上下文"""
+
+    @pytest.fixture
+    def view(self):
+        SeenRequestViewSet.generate_endpoint()
+        SeenRequestResource.seen = []
+        return SeenRequestViewSet.as_view({"get": "list"})
+
+    def test_request_not_leaked(self, view):
+        """测试请求处理时可读取当前请求，结束后不遗留到当前线程"""
+        response = view(APIRequestFactory().get("/", {"name": "alice"}))
+
+        assert response.status_code == 200
+        [seen] = SeenRequestResource.seen
+        assert seen.query_params["name"] == "alice"
+        assert get_request(peaceful=True) is None
+        assert not hasattr(local, "current_request")
+
+    def test_outer_request_restored(self, view):
+        """测试请求结束后还原外层设置的请求"""
+        outer = _request("outer")
+        set_current_request(outer)
+
+        view(APIRequestFactory().get("/"))
+
+        assert SeenRequestResource.seen[0] is not outer
+        assert get_request() is outer
+
+
+class TestWithRequestLocal:
+    """测试 with_request_local 对当前请求的隔离"""
+
+    def test_hides_and_restores_request(self):
+        """测试上下文内读取不到外部请求，退出后恢复外部请求"""
+        outer = _request("outer")
+        set_current_request(outer)
+
+        with with_request_local():
+            assert get_request(peaceful=True) is None
+
+            inner = _request("inner")
+            set_current_request(inner)
+            assert get_request() is inner
+
+        assert get_request() is outer
+        assert local.current_request is outer
+
+
+class TestResourceCurrentRequest:
+    """测试 Resource._current_request 的读取顺序"""
+
+    def test_reads_request_context(self):
+        """测试未绑定 request 时读取当前上下文中的请求"""
+        resource = EchoResource()
+        assert resource._current_request is None
+
+        request = _request("alice")
+        set_current_request(request)
+
+        assert resource._current_request is request
+
+    def test_bound_request_takes_precedence(self):
+        """测试显式绑定的 request 优先于上下文中的请求"""
+        set_current_request(_request("context"))
+        bound = _request("bound")
+
+        resource = EchoResource()
+        resource._current_request = bound
+
+        assert resource._current_request is bound
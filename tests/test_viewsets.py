@@ -0,0 +1,405 @@
+"""
+ResourceViewSet 单元测试
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from drf_resource.resources.base import Resource
+from drf_resource.views import viewsets
+from drf_resource.views.routers import ResourceRouter
+from drf_resource.views.viewsets import (
+    ResourceMapping,
+    ResourceRoute,
+    ResourceViewSet,
+)
+
+# ========== 测试用的具体实现类 ==========
+
+
+class EchoRequestSerializer(serializers.Serializer):
+    name = serializers.CharField()
+
+
+class EchoResource(Resource):
+    """回显请求参数"""
+
+    RequestSerializer = EchoRequestSerializer
+
+    def perform_request(self, validated_request_data):
+        return validated_request_data
+
+
+class TaggingResource(EchoResource):
+    """校验前在请求参数中写入来源标记"""
+
+    def validate_request_data(self, request_data):
+        request_data["source"] = "view"
+        return super().validate_request_data(request_data)
+
+
+class SharedEchoResource(EchoResource):
+    """复用实例，返回处理时读取到的当前请求与实例上的属性"""
+
+    reuse_instance = True
+    # 两个请求同时进入 perform_request 后再返回，确保请求处理相互重叠
+    barrier = threading.Barrier(2, timeout=5)
+
+    def perform_request(self, validated_request_data):
+        self.barrier.wait()
+        return {
+            "name": validated_request_data["name"],
+            "seen": self._current_request.query_params["name"],
+            "instance": id(self),
+            "state": sorted(vars(self)),
+        }
+
+
+class SharedContextResource(EchoResource):
+    """复用实例，返回 url 参数 context"""
+
+    reuse_instance = True
+    RequestSerializer = None
+
+    def perform_request(self, validated_request_data):
+        return {"context": self.context, "instance": id(self)}
+
+
+def _make_viewset():
+    """每次返回新的 ViewSet 类，避免 generate_endpoint 的类级状态在用例间共享"""
+
+    class EchoViewSet(ResourceViewSet):
+        resource_routes = [
+            ResourceRoute("GET", EchoResource),
+            ResourceRoute("POST", EchoResource, endpoint="echo"),
+        ]
+
+    return EchoViewSet
+
+
+# ========== 测试类 ==========
+
+
+class TestDeferredSchemaDecorators:
+    """测试 API 文档装饰器延迟到 schema 生成时应用"""
+
+    @pytest.fixture
+    def decorated(self, monkeypatch):
+        """替换 schema 装饰器，记录被应用装饰器的视图函数"""
+        decorated = []
+
+        def counting_decorator(**kwargs):
+            def decorate(function):
+                decorated.append(function)
+                return function
+
+            return decorate
+
+        monkeypatch.setattr(
+            viewsets, "_get_schema_decorator", lambda: counting_decorator
+        )
+        return decorated
+
+    def test_applied_once_on_concurrent_schema_access(self, decorated):
+        """测试实例化不触发装饰器，并发读取 schema 时每个视图函数只应用一次"""
+        viewset = _make_viewset()
+        viewset.generate_endpoint()
+
+        viewset()
+        assert decorated == []
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: viewset.schema, range(16)))
+        viewset.schema
+
+        assert len(decorated) == len(viewset.resource_routes)
+        assert len(set(decorated)) == len(decorated)
+
+    def test_custom_schema_applied_eagerly(self, decorated):
+        """测试自定义 schema 的 ViewSet 在生成端点时立即应用装饰器"""
+        from rest_framework.schemas.openapi import AutoSchema
+
+        class CustomSchemaViewSet(_make_viewset()):
+            schema = AutoSchema()
+
+        CustomSchemaViewSet.generate_endpoint()
+        assert len(decorated) == len(CustomSchemaViewSet.resource_routes)
+
+        CustomSchemaViewSet.schema
+        assert len(decorated) == len(CustomSchemaViewSet.resource_routes)
+
+    def test_preprocessing_hook_applies(self, decorated):
+        """测试 drf-spectacular 预处理钩子应用延迟的装饰器"""
+        pytest.importorskip("drf_spectacular")
+        from drf_resource.contrib.spectacular import preprocess_resource_routes
+
+        viewset = _make_viewset()
+        viewset.generate_endpoint()
+        callback = viewset.as_view({"get": "list"})
+
+        preprocess_resource_routes([("/echo/", "^echo/$", "GET", callback)])
+
+        assert len(decorated) == len(viewset.resource_routes)
+
+    def test_schema_output_unchanged(self, settings):
+        """测试延迟应用与提前应用装饰器生成的 schema 一致"""
+        pytest.importorskip("drf_spectacular")
+        from drf_spectacular.generators import SchemaGenerator
+        from drf_spectacular.openapi import AutoSchema
+
+        class CustomAutoSchema(AutoSchema):
+            pass
+
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+        }
+
+        def generate(eager, schema=None):
+            viewset = _make_viewset()
+            if schema is not None:
+                viewset = type(viewset.__name__, (viewset,), {"schema": schema})
+            viewset.generate_endpoint()
+            if eager:
+                viewset._apply_schema_decorators()
+            router = ResourceRouter()
+            router.register("echo", viewset, basename="echo")
+            generator = SchemaGenerator(patterns=router.urls)
+            return generator.get_schema(request=None, public=True)
+
+        deferred = generate(eager=False)
+
+        operation = deferred["paths"]["/echo/echo/"]["post"]
+        assert operation["description"] == EchoResource.__doc__
+        assert "requestBody" in operation
+        assert deferred == generate(eager=True)
+        # 自定义 AutoSchema 子类的 ViewSet 同样带有完整的文档信息
+        assert deferred == generate(eager=False, schema=CustomAutoSchema())
+
+
+class TestResourceRoute:
+    """测试 ResourceRoute 的初始化"""
+
+    @pytest.mark.parametrize("endpoint", ["", None], ids=["empty", "none"])
+    def test_empty_endpoint(self, endpoint):
+        """测试未提供 endpoint 时按标准方法处理"""
+        route = ResourceRoute("GET", EchoResource, endpoint=endpoint)
+        assert route.endpoint == ""
+        assert route.url_name == ""
+
+    def test_endpoint_url_config(self):
+        """测试 action 端点的 url 配置与视图函数名"""
+        route = ResourceRoute("POST", EchoResource, endpoint="batch_echo")
+        assert route.url_path == "batch_echo"
+        assert route.url_name == "batch-echo"
+        assert route.func_name == "batch_echo"
+
+        assert ResourceRoute("GET", EchoResource, "detail").func_name == (
+            "api_func_detail"
+        )
+
+
+class TestParamGetter:
+    """测试 GET 请求参数的获取方式"""
+
+    def test_default_resource_reads_query_params(self):
+        """测试未重写参数处理方法的 resource 直接使用 query_params"""
+        request = APIRequestFactory().get("/", {"name": "alice"})
+        request.query_params = request.GET
+
+        route = ResourceRoute("GET", EchoResource)
+
+        assert route.param_getter(request) is request.query_params
+
+    def test_mutating_resource_gets_mutable_copy(self):
+        """测试重写 validate_request_data 并修改参数的 resource 收到可修改的副本"""
+
+        class TaggingViewSet(ResourceViewSet):
+            resource_routes = [ResourceRoute("GET", TaggingResource)]
+
+        TaggingViewSet.generate_endpoint()
+        view = TaggingViewSet.as_view({"get": "list"})
+
+        response = view(APIRequestFactory().get("/", {"name": "alice"}))
+
+        assert response.status_code == 200
+        assert response.data == {"name": "alice"}
+
+
+class TestGenerateEndpoint:
+    """测试 generate_endpoint 的幂等保护"""
+
+    def test_generate_twice(self):
+        """测试重复调用不会重新生成视图函数"""
+        viewset = _make_viewset()
+        viewset.generate_endpoint()
+        functions = (viewset.list, viewset.echo)
+        pending = viewset._pending_schema_functions
+
+        viewset.generate_endpoint()
+
+        assert (viewset.list, viewset.echo) == functions
+        assert viewset._pending_schema_functions is pending
+        assert [action.__name__ for action in viewset.get_extra_actions()] == ["echo"]
+
+    def test_subclass_of_generated_viewset(self):
+        """测试已生成端点的 ViewSet 的子类生成自己的端点，且不会重复"""
+        parent = _make_viewset()
+        parent.generate_endpoint()
+
+        class ChildViewSet(parent):
+            pass
+
+        router = ResourceRouter()
+        router.register("parent", parent, basename="parent")
+        router.register("child", ChildViewSet, basename="child")
+        router.register("child-again", ChildViewSet, basename="child-again")
+
+        assert ChildViewSet.echo is not parent.echo
+        mapping = ResourceViewSet.resource_mapping
+        for viewset in (parent, ChildViewSet):
+            view_set_path = f"{viewset.__module__}.{viewset.__name__}"
+            assert mapping.lookup(view_set_path, "echo", "POST") is EchoResource
+        assert [action.__name__ for action in ChildViewSet.get_extra_actions()] == [
+            "echo"
+        ]
+        assert len(router.get_routes(ChildViewSet)) == len(router.get_routes(parent))
+
+
+class TestResourceMapping:
+    """测试 ResourceMapping 的注册与查询"""
+
+    VIEW_SET_PATH = "app.views.EchoViewSet"
+
+    @pytest.fixture
+    def mapping(self):
+        mapping = ResourceMapping()
+        mapping.register(self.VIEW_SET_PATH, "list", "GET", EchoResource)
+        mapping.register(self.VIEW_SET_PATH, "sub-path", "POST", TaggingResource)
+        return mapping
+
+    def test_legacy_view(self, mapping):
+        """测试按旧的 (method, "view_set_path-action") 元组 key 存储与迭代"""
+        assert dict(mapping) == {
+            ("GET", "app.views.EchoViewSet-list"): EchoResource,
+            ("POST", "app.views.EchoViewSet-sub-path"): TaggingResource,
+        }
+        assert len(mapping) == 2
+        assert ("GET", "app.views.EchoViewSet-list") in mapping
+        assert mapping.get(("POST", "app.views.EchoViewSet-list")) is None
+
+    @pytest.mark.parametrize(
+        "action_name,method,expected",
+        [
+            ("list", "GET", EchoResource),
+            ("sub-path", "POST", TaggingResource),
+            ("list", "POST", None),
+            ("missing", "GET", None),
+        ],
+        ids=["plain", "hyphenated_action", "method", "action"],
+    )
+    def test_lookup(self, mapping, action_name, method, expected):
+        """测试按 view_set_path、action、method 嵌套查询"""
+        assert mapping.lookup(self.VIEW_SET_PATH, action_name, method) is expected
+
+    def test_lookup_missing_view_set(self, mapping):
+        """测试未注册的 ViewSet 返回默认值"""
+        assert mapping.lookup("app.views.OtherViewSet", "list", "GET", "-") == "-"
+
+
+class TestReuseInstance:
+    """测试 reuse_instance 复用实例时请求间的隔离"""
+
+    def test_concurrent_requests_isolated(self):
+        """测试复用同一实例的并发请求各自读取到自己的请求"""
+
+        class SharedViewSet(ResourceViewSet):
+            resource_routes = [ResourceRoute("GET", SharedEchoResource)]
+
+        SharedViewSet.generate_endpoint()
+        view = SharedViewSet.as_view({"get": "list"})
+        factory = APIRequestFactory()
+
+        def call(name):
+            return view(factory.get("/", {"name": name})).data
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(call, ["alice", "bob"]))
+
+        assert [result["seen"] for result in results] == ["alice", "bob"]
+        assert [result["name"] for result in results] == ["alice", "bob"]
+        assert results[0]["instance"] == results[1]["instance"]
+        # 请求处理期间实例上只有构造时的属性，没有保存请求级的 serializer
+        assert results[0]["state"] == results[1]["state"]
+        assert "_request_serializer" not in results[0]["state"]
+        assert "_response_serializer" not in results[0]["state"]
+        assert SharedEchoResource._bound_request is None
+
+    def test_serializer_properties_unavailable(self):
+        """测试复用实例不提供 request_serializer/response_serializer"""
+        resource = SharedContextResource()
+        resource.request({"name": "alice"})
+
+        with pytest.raises(AssertionError, match="reuse_instance"):
+            resource.request_serializer
+        with pytest.raises(AssertionError, match="reuse_instance"):
+            resource.response_serializer
+
+    def test_url_kwargs_keep_context(self):
+        """测试带 url 参数的请求单独实例化，context 不丢失"""
+
+        class ContextViewSet(ResourceViewSet):
+            resource_routes = [
+                ResourceRoute("GET", SharedContextResource),
+                ResourceRoute("GET", SharedContextResource, pk_field="id"),
+            ]
+
+        ContextViewSet.generate_endpoint()
+        list_view = ContextViewSet.as_view({"get": "list"})
+        detail_view = ContextViewSet.as_view({"get": "retrieve"})
+        factory = APIRequestFactory()
+
+        shared = [list_view(factory.get("/")).data for _ in range(2)]
+        detail = detail_view(factory.get("/1/"), pk="1").data
+
+        assert shared[0]["instance"] == shared[1]["instance"]
+        assert shared[0]["context"] == {}
+        assert detail["context"] == {"pk": "1"}
+        assert detail["instance"] != shared[0]["instance"]
+
+
+class TestAsyncTaskHeader:
+    """测试 X-Async-Task 请求头与 allow_async 配置"""
+
+    @pytest.mark.parametrize(
+        "allow_async,expected",
+        [(True, {"task_id": "task-1"}), (False, {"name": "alice"})],
+        ids=["allowed", "disallowed"],
+    )
+    def test_async_header(self, monkeypatch, allow_async, expected):
+        """测试允许异步时请求头转为异步任务，不允许时忽略请求头同步执行"""
+        delayed = []
+
+        def fake_delay(self, request_data=None, **kwargs):
+            delayed.append(request_data)
+            return {"task_id": "task-1"}
+
+        monkeypatch.setattr(EchoResource, "delay", fake_delay)
+
+        class AsyncViewSet(ResourceViewSet):
+            resource_routes = [
+                ResourceRoute("GET", EchoResource, allow_async=allow_async)
+            ]
+
+        AsyncViewSet.generate_endpoint()
+        view = AsyncViewSet.as_view({"get": "list"})
+
+        request = APIRequestFactory().get("/", {"name": "alice"}, HTTP_X_ASYNC_TASK="1")
+        response = view(request)
+
+        assert response.data == expected
+        assert len(delayed) == (1 if allow_async else 0)